@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Machine-readable change feed for glossary syncs.
+
+Every sync compares the completed terms against the state recorded by the
+previous sync and appends one JSON event per changed term to
+src/data/changes/changes.jsonl. Downstream steps (data generation, search
+indexing, cache purges) replay events since their last checkpoint instead
+of reprocessing the whole corpus.
+
+Event format (one JSON object per line):
+    {
+      "seq": 42,                          <- monotonically increasing across syncs
+      "sync_id": "2026-01-31T12:00:00Z",
+      "revision": "ALm37BV...",           <- Docs revisionId (or docx:<hash> for offline syncs)
+      "type": "updated",                  <- added | updated | removed | renamed
+      "id": "attack-reset",
+      "old_id": null,                     <- previous ID for renamed terms
+      "fields": ["definition", "links"],  <- changed fields (term, tags, alternates, links, definition)
+      "old_hash": "9f2c...",              <- hash of the previous markdown (null when added)
+      "new_hash": "1b7e..."               <- hash of the new markdown (null when removed)
+    }
+
+The feed describes the markdown files in src/data/terms, which is what
+the site publishes. The sync never deletes those files, so a term that is
+no longer completed in the doc (or fails to write) keeps its previous
+state and produces no event. "removed" is only reported once the term's
+markdown file is gone.
+
+A new ID counts as renamed when a term from the previous state that this
+sync no longer produces has the same definition, or the new term lists
+its old name under "Also known as". The old markdown file isn't deleted
+by the sync, so old_id stays published until its file is removed (which
+then produces a "removed" event).
+
+Rotation: when changes.jsonl grows past FEED_CONFIG["max_bytes"] it is
+renamed to changes.<first-seq>.jsonl and a new file is started; only the
+newest FEED_CONFIG["max_archives"] archives are kept. Consumers whose
+checkpoint predates the oldest retained event get a FeedGapError and
+should fall back to a full rebuild.
+
+On the first sync (no state file yet), state is seeded from the markdown
+files already in src/data/terms, so only real changes are reported. The
+state is saved after every sync, including syncs with no changes. If the
+state file is lost while feed files remain, seq numbering continues from
+the newest event in the feed, so seqs never repeat.
+
+Usage:
+    python scripts/change_feed.py --since 0                   # Print all retained events
+    python scripts/change_feed.py --consumer search-index     # Events since that consumer's checkpoint
+    python scripts/change_feed.py --consumer search-index --ack  # ...and advance the checkpoint
+    python scripts/change_feed.py --check                     # Run sync scenarios on the fixture doc
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+from sync_glossary import CONFIG, Term
+
+
+# Configuration
+FEED_CONFIG = {
+    # Feed directory relative to project root
+    "feed_dir": "src/data/changes",
+
+    # Current feed file, sync state and consumer checkpoints (in feed_dir)
+    "feed_file": "changes.jsonl",
+    "state_file": "state.json",
+    "checkpoint_dir": "checkpoints",
+
+    # Rotate the current feed file once it exceeds this size
+    "max_bytes": 1_000_000,
+
+    # Rotated files kept (oldest are deleted)
+    "max_archives": 10,
+}
+
+# Term fields tracked for "fields" in update events
+TRACKED_FIELDS = ("term", "tags", "alternates", "links", "definition")
+
+ARCHIVE_RE = re.compile(r"^changes\.(\d+)\.jsonl$")
+
+
+class FeedGapError(ValueError):
+    """Raised when a checkpoint is older than the oldest retained event."""
+
+
+def content_hash(text: str) -> str:
+    """Short SHA-256 of a string (enough to detect changes, small in the feed)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _field_hashes(values: dict) -> dict[str, str]:
+    """Hash each tracked field's value."""
+    return {field: content_hash(json.dumps(values[field], ensure_ascii=False)) for field in TRACKED_FIELDS}
+
+
+def _alias_ids(alternates: list[str]) -> list[str]:
+    """Alternate names as IDs (to recognize a rename that keeps the old name as an alternate)."""
+    return sorted({Term.normalize_to_id(alternate) for alternate in alternates})
+
+
+def term_state(term: Term) -> dict:
+    """State recorded for a synced term: markdown hash, per-field hashes and alternate IDs."""
+    return {
+        "hash": content_hash(term.to_markdown()),
+        "aliases": _alias_ids(term.alternates),
+        "fields": _field_hashes({
+            "term": term.clean_name,
+            "tags": term.effective_tags,
+            "alternates": term.alternates,
+            "links": term.links,
+            "definition": term.definition,
+        }),
+    }
+
+
+def seed_state_from_disk(terms_dir: Path) -> dict[str, dict]:
+    """Build initial state from existing markdown files (first sync only)."""
+    from term_corpus import load_corpus
+
+    state = {}
+    if not terms_dir.exists():
+        return state
+    for record in load_corpus(terms_dir):
+        state[record.id] = {
+            "hash": content_hash(record.path.read_text(encoding="utf-8")),
+            "aliases": _alias_ids(record.alternates),
+            "fields": _field_hashes({
+                "term": record.term,
+                "tags": record.tags,
+                "alternates": record.alternates,
+                "links": record.links,
+                "definition": record.body,
+            }),
+        }
+    return state
+
+
+def diff_states(old: dict[str, dict], new: dict[str, dict],
+                produced: Optional[set[str]] = None) -> list[dict]:
+    """
+    Compare two states and return events (without seq/sync metadata),
+    ordered by term ID within each type.
+
+    `produced` is the set of IDs the sync itself wrote. Old IDs outside it
+    are rename candidates even if they're still in `new` (their file still
+    exists); by default only IDs missing from `new` are.
+    """
+    if produced is None:
+        produced = set(new)
+    added = sorted(new.keys() - old.keys())
+    removed = sorted(old.keys() - new.keys())
+    events = []
+
+    # Pair added terms with old terms this sync no longer produces: first by
+    # the old name appearing as an alternate, then by identical definition
+    candidates = sorted(old.keys() - produced)
+    by_definition: dict[str, list[str]] = {}
+    for term_id in candidates:
+        by_definition.setdefault(old[term_id]["fields"]["definition"], []).append(term_id)
+
+    renamed_from: dict[str, str] = {}
+    paired: set[str] = set()
+    for term_id in added:
+        match = next((old_id for old_id in new[term_id].get("aliases", [])
+                      if old_id in old and old_id not in produced and old_id not in paired), None)
+        if match is None:
+            match = next((old_id for old_id in by_definition.get(new[term_id]["fields"]["definition"], [])
+                          if old_id not in paired), None)
+        if match is not None:
+            renamed_from[term_id] = match
+            paired.add(match)
+
+    def changed_fields(before: dict, after: dict) -> list[str]:
+        return [f for f in TRACKED_FIELDS if before["fields"].get(f) != after["fields"].get(f)]
+
+    for term_id in sorted(new.keys() & old.keys()):
+        if old[term_id]["hash"] != new[term_id]["hash"]:
+            events.append({
+                "type": "updated", "id": term_id, "old_id": None,
+                "fields": changed_fields(old[term_id], new[term_id]),
+                "old_hash": old[term_id]["hash"], "new_hash": new[term_id]["hash"],
+            })
+
+    for term_id in added:
+        if term_id in renamed_from:
+            old_id = renamed_from[term_id]
+            events.append({
+                "type": "renamed", "id": term_id, "old_id": old_id,
+                "fields": changed_fields(old[old_id], new[term_id]),
+                "old_hash": old[old_id]["hash"], "new_hash": new[term_id]["hash"],
+            })
+        else:
+            events.append({
+                "type": "added", "id": term_id, "old_id": None,
+                "fields": list(TRACKED_FIELDS),
+                "old_hash": None, "new_hash": new[term_id]["hash"],
+            })
+
+    renamed_ids = set(renamed_from.values())
+    for term_id in removed:
+        if term_id not in renamed_ids:
+            events.append({
+                "type": "removed", "id": term_id, "old_id": None,
+                "fields": [],
+                "old_hash": old[term_id]["hash"], "new_hash": None,
+            })
+
+    return events
+
+
+def _archives(feed_dir: Path) -> list[tuple[int, Path]]:
+    """Rotated feed files as (first seq, path), oldest first."""
+    archives = []
+    if feed_dir.exists():
+        with os.scandir(feed_dir) as entries:
+            for entry in entries:
+                match = ARCHIVE_RE.match(entry.name)
+                if match:
+                    archives.append((int(match.group(1)), Path(entry.path)))
+    return sorted(archives)
+
+
+def _first_seq(path: Path) -> Optional[int]:
+    """Seq of the first event in a feed file (None if empty)."""
+    with open(path, encoding="utf-8") as f:
+        line = f.readline()
+    return json.loads(line)["seq"] if line.strip() else None
+
+
+def _rotate_if_needed(feed_dir: Path):
+    """Move the current feed file to an archive once it is too big."""
+    feed_path = feed_dir / FEED_CONFIG["feed_file"]
+    if not feed_path.exists() or feed_path.stat().st_size < FEED_CONFIG["max_bytes"]:
+        return
+
+    first_seq = _first_seq(feed_path)
+    if first_seq is None:
+        return
+    # Zero-padded so archives also sort correctly by name
+    feed_path.rename(feed_dir / f"changes.{first_seq:010d}.jsonl")
+
+    archives = _archives(feed_dir)
+    for _, path in archives[:max(len(archives) - FEED_CONFIG["max_archives"], 0)]:
+        path.unlink()
+
+
+def _last_seq(path: Path) -> Optional[int]:
+    """Seq of the last event in a feed file (None if empty)."""
+    last = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                last = line
+    return json.loads(last)["seq"] if last is not None else None
+
+
+def feed_last_seq(feed_dir: Path) -> int:
+    """Seq of the newest event in the feed or its archives (0 if there are none)."""
+    files = [path for _, path in _archives(feed_dir)]
+    feed_path = feed_dir / FEED_CONFIG["feed_file"]
+    if feed_path.exists():
+        files.append(feed_path)
+    for path in reversed(files):
+        seq = _last_seq(path)
+        if seq is not None:
+            return seq
+    return 0
+
+
+def load_sync_state(project_root: Path) -> dict:
+    """
+    Load the state recorded by the previous sync, seeding it from the
+    markdown files on disk if there is none. Must be called before the
+    sync overwrites any files.
+
+    A seeded state continues seq numbering from any events already in the
+    feed, so a lost state file can't make seqs repeat.
+    """
+    feed_dir = project_root / FEED_CONFIG["feed_dir"]
+    state_path = feed_dir / FEED_CONFIG["state_file"]
+    if state_path.exists():
+        return json.loads(state_path.read_text(encoding="utf-8"))
+    return {
+        "last_seq": feed_last_seq(feed_dir),
+        "terms": seed_state_from_disk(project_root / CONFIG["output_dir"]),
+    }
+
+
+def record_sync(terms: list[Term], project_root: Path, revision: Optional[str], previous: dict,
+                dry_run: bool = False, keep_ids: Optional[set[str]] = None) -> list[dict]:
+    """
+    Diff synced terms against the previous sync state (from load_sync_state())
+    and append events to the feed.
+
+    keep_ids are terms whose files failed to write: their previous state is
+    carried over unchanged so they're retried (and reported) next sync.
+    Terms missing from this sync keep their previous state while their
+    markdown file exists; only deleted files are reported as removed.
+    The state is written even when there are no events.
+    Returns the events (with seq numbers) that were, or in a dry run would be, appended.
+    """
+    feed_dir = project_root / FEED_CONFIG["feed_dir"]
+    state_path = feed_dir / FEED_CONFIG["state_file"]
+    terms_dir = project_root / CONFIG["output_dir"]
+
+    keep_ids = keep_ids or set()
+    current = {term.id: term_state(term) for term in terms if term.id not in keep_ids}
+    produced = set(current)
+    for term_id, state in previous["terms"].items():
+        if term_id not in current and (terms_dir / f"{term_id}.md").exists():
+            current[term_id] = state
+
+    sync_id = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    events = []
+    seq = previous["last_seq"]
+    for event in diff_states(previous["terms"], current, produced):
+        seq += 1
+        events.append({"seq": seq, "sync_id": sync_id, "revision": revision, **event})
+
+    if dry_run:
+        return events
+
+    feed_dir.mkdir(parents=True, exist_ok=True)
+    if events:
+        _rotate_if_needed(feed_dir)
+        with open(feed_dir / FEED_CONFIG["feed_file"], "a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    # State is written after the feed, so a crash can't lose events (at worst
+    # the next sync re-reports the same changes)
+    state_path.write_text(
+        json.dumps({"last_seq": seq, "terms": current}, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+    return events
+
+
+def replay(since: int, feed_dir: Optional[Path] = None) -> Iterator[dict]:
+    """
+    Yield events with seq > since, oldest first, across rotated files.
+    Raises FeedGapError if events after `since` have been rotated away.
+    """
+    if feed_dir is None:
+        feed_dir = Path(__file__).parent.parent / FEED_CONFIG["feed_dir"]
+
+    files = [path for _, path in _archives(feed_dir)]
+    feed_path = feed_dir / FEED_CONFIG["feed_file"]
+    if feed_path.exists():
+        files.append(feed_path)
+
+    # Skip whole files that end before the checkpoint
+    starts = [_first_seq(path) for path in files]
+    first_retained = next((s for s in starts if s is not None), None)
+    if first_retained is not None and first_retained > since + 1:
+        raise FeedGapError(
+            f"Checkpoint {since} is older than the oldest retained event ({first_retained}). "
+            f"Do a full rebuild and restart from the latest seq."
+        )
+
+    for index, path in enumerate(files):
+        next_start = next((s for s in starts[index + 1:] if s is not None), None)
+        if next_start is not None and next_start <= since + 1:
+            continue
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if event["seq"] > since:
+                    yield event
+
+
+def latest_seq(feed_dir: Optional[Path] = None) -> int:
+    """Seq of the most recent event (0 if no sync has recorded events yet)."""
+    if feed_dir is None:
+        feed_dir = Path(__file__).parent.parent / FEED_CONFIG["feed_dir"]
+    state_path = feed_dir / FEED_CONFIG["state_file"]
+    if not state_path.exists():
+        return feed_last_seq(feed_dir)
+    return json.loads(state_path.read_text(encoding="utf-8"))["last_seq"]
+
+
+def load_checkpoint(consumer: str, feed_dir: Optional[Path] = None) -> int:
+    """Last seq a consumer has processed (0 if it has never run)."""
+    if feed_dir is None:
+        feed_dir = Path(__file__).parent.parent / FEED_CONFIG["feed_dir"]
+    path = feed_dir / FEED_CONFIG["checkpoint_dir"] / f"{consumer}.json"
+    if not path.exists():
+        return 0
+    return json.loads(path.read_text(encoding="utf-8"))["seq"]
+
+
+def save_checkpoint(consumer: str, seq: int, feed_dir: Optional[Path] = None):
+    """Record that a consumer has processed every event up to seq."""
+    if feed_dir is None:
+        feed_dir = Path(__file__).parent.parent / FEED_CONFIG["feed_dir"]
+    checkpoint_dir = feed_dir / FEED_CONFIG["checkpoint_dir"]
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    (checkpoint_dir / f"{consumer}.json").write_text(json.dumps({"seq": seq}) + "\n", encoding="utf-8")
+
+
+def _paragraph(text: str, style: str = "NORMAL_TEXT") -> dict:
+    """A Docs API paragraph element."""
+    return {"paragraph": {"paragraphStyle": {"namedStyleType": style},
+                          "elements": [{"textRun": {"content": text + "\n"}}]}}
+
+
+def _find_paragraph(content: list[dict], text: str) -> int:
+    """Index of the paragraph whose text is exactly `text`."""
+    for index, element in enumerate(content):
+        runs = element.get("paragraph", {}).get("elements", [])
+        if "".join(run.get("textRun", {}).get("content", "") for run in runs).rstrip("\n") == text:
+            return index
+    raise ValueError(f"Paragraph not found: {text!r}")
+
+
+def _sync_doc(doc: dict, project_root: Path) -> list[dict]:
+    """Run the parse -> write -> record steps of a sync against project_root."""
+    from sync_glossary import GoogleDocsParser, normalize_and_validate_links
+
+    terms = GoogleDocsParser().parse_document(doc, CONFIG["tab_name"])
+    completed = [t for t in terms if t.is_completed]
+    with contextlib.redirect_stdout(io.StringIO()):
+        normalize_and_validate_links(completed)
+
+    previous = load_sync_state(project_root)
+    terms_dir = project_root / CONFIG["output_dir"]
+    terms_dir.mkdir(parents=True, exist_ok=True)
+    for term in completed:
+        (terms_dir / term.filename).write_text(term.to_markdown(), encoding="utf-8")
+    return record_sync(completed, project_root, doc.get("revisionId"), previous)
+
+
+def run_checks() -> bool:
+    """
+    Sync the fixture doc through a series of edits in a scratch project and
+    check the events: doc-side renames, removals, and seq continuity after
+    the state file is lost.
+    """
+    from docx_source import FIXTURE_DOC_JSON
+
+    doc = json.loads(FIXTURE_DOC_JSON.read_text(encoding="utf-8"))
+    content = next(tab for tab in doc["tabs"]
+                   if tab["tabProperties"]["title"] == CONFIG["tab_name"])["documentTab"]["body"]["content"]
+    tmp_dir = Path(tempfile.mkdtemp(prefix="feed-check-"))
+    feed_dir = tmp_dir / FEED_CONFIG["feed_dir"]
+    terms_dir = tmp_dir / CONFIG["output_dir"]
+
+    def summary(events: list[dict]) -> list[tuple]:
+        return [(e["type"], e["id"], e["old_id"]) for e in events]
+
+    results = []
+
+    def check(label: str, passed: bool, detail: object = ""):
+        results.append(passed)
+        print(f"  {'✓' if passed else '✗'} {label}" + ("" if passed else f": {detail}"))
+
+    try:
+        events = _sync_doc(doc, tmp_dir)
+        check("first sync adds completed terms",
+              sorted(summary(events)) == [("added", "attack-reset", None), ("added", "freeze", None),
+                                          ("added", "last-hit", None)], summary(events))
+
+        events = _sync_doc(doc, tmp_dir)
+        check("unchanged resync records nothing", events == [], summary(events))
+
+        # Heading renamed, definition untouched
+        content[_find_paragraph(content, "Freeze ✓")] = _paragraph("Wave Freeze ✓", "HEADING_2")
+        events = _sync_doc(doc, tmp_dir)
+        check("rename pairs by definition",
+              summary(events) == [("renamed", "wave-freeze", "freeze")], summary(events))
+        check("renamed term's old file stays published", (terms_dir / "freeze.md").exists())
+
+        # Heading renamed, definition edited, old name kept as an alternate
+        index = _find_paragraph(content, "Last Hit ✓")
+        content[index] = _paragraph("Last Hitting ✓", "HEADING_2")
+        content.insert(index + 1, _paragraph("Also known as: Last Hit"))
+        definition = _find_paragraph(content, "Landing the killing blow on a minion.\tTabs are kept.")
+        content[definition] = _paragraph("Landing the killing blow on a minion or monster.")
+        events = _sync_doc(doc, tmp_dir)
+        renamed = [e for e in events if e["type"] == "renamed"]
+        check("rename pairs by alternate name",
+              summary(renamed) == [("renamed", "last-hitting", "last-hit")]
+              and "definition" in renamed[0]["fields"] and "added" not in {e["type"] for e in events},
+              summary(events))
+
+        (terms_dir / "freeze.md").unlink()
+        events = _sync_doc(doc, tmp_dir)
+        check("deleted file is reported as removed",
+              summary(events) == [("removed", "freeze", None)], summary(events))
+
+        last = latest_seq(feed_dir)
+        (feed_dir / FEED_CONFIG["state_file"]).unlink()
+        content[_find_paragraph(content, "Holding the wave near your tower.")] = \
+            _paragraph("Holding the wave just outside your tower.")
+        events = _sync_doc(doc, tmp_dir)
+        check("seq continues after the state file is lost",
+              [e["seq"] for e in events] == [last + 1] and latest_seq(feed_dir) == last + 1,
+              [e["seq"] for e in events])
+        seqs = [e["seq"] for e in replay(0, feed_dir)]
+        check("feed seqs are unique and increasing", seqs == sorted(set(seqs)), seqs)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    return all(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay glossary sync change events.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--since", type=int, help="Print events after this seq")
+    group.add_argument("--consumer", help="Print events after this consumer's checkpoint")
+    group.add_argument(
+        "--check",
+        action="store_true",
+        help="Run rename/removal/seq scenarios on the fixture doc in a scratch project"
+    )
+    parser.add_argument(
+        "--ack",
+        action="store_true",
+        help="With --consumer: advance the checkpoint past the printed events"
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        print("Checking change feed scenarios...")
+        if not run_checks():
+            raise SystemExit(1)
+        print("✓ All change feed checks passed")
+        return
+
+    since = args.since if args.since is not None else load_checkpoint(args.consumer)
+    try:
+        events = list(replay(since))
+    except FeedGapError as e:
+        print(f"Error: {e}")
+        raise SystemExit(2)
+
+    for event in events:
+        print(json.dumps(event, ensure_ascii=False))
+
+    if args.consumer and args.ack and events:
+        save_checkpoint(args.consumer, events[-1]["seq"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Offline sync source: read glossary terms from a .docx export of the doc.
+
+Instead of calling the Docs API, this streams word/document.xml out of the
+.docx archive with iterparse and converts each top-level paragraph into the
+same structural element shape the API returns:
+
+    {"paragraph": {"paragraphStyle": {"namedStyleType": "HEADING_2"},
+                   "elements": [{"textRun": {"content": "Attack Reset ✓\\n"}}]}}
+
+Those elements are fed to GoogleDocsParser.parse_elements(), so term
+parsing, metadata lines and link normalization are shared with the API
+path. Paragraphs are discarded as soon as they are converted, so memory
+stays bounded by the parsed terms rather than the size of the export.
+
+Style mapping (via word/styles.xml, so renamed or localized style IDs work):
+    - "heading 1" -> HEADING_1 (section)
+    - "heading 2" -> HEADING_2 (term)
+    - anything else -> NORMAL_TEXT
+
+Note: a .docx export has no tabs - export the "Written Definitions" tab
+on its own (File -> Download -> Microsoft Word) before syncing.
+
+Usage:
+    python scripts/sync_glossary.py --docx glossary.docx            # Sync from export
+    python scripts/docx_source.py glossary.docx --compare doc.json  # Check against API output
+    python scripts/docx_source.py --check                           # Check the bundled fixture pair
+
+The fixture pair in scripts/fixtures/docx/ (glossary.docx and the matching
+Docs API response doc.json) covers headings, metadata lines, blank lines,
+a table, tabs and soft line breaks.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import zipfile
+from pathlib import Path
+from typing import Iterator
+from xml.etree import ElementTree as ET
+
+from sync_glossary import CONFIG, GoogleDocsParser, Term
+
+
+# WordprocessingML namespaces
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+
+W_BODY = f"{W_NS}body"
+W_P = f"{W_NS}p"
+W_PPR = f"{W_NS}pPr"
+W_PSTYLE = f"{W_NS}pStyle"
+W_T = f"{W_NS}t"
+W_TAB = f"{W_NS}tab"
+W_BR = f"{W_NS}br"
+W_CR = f"{W_NS}cr"
+W_VAL = f"{W_NS}val"
+W_STYLE = f"{W_NS}style"
+W_STYLE_ID = f"{W_NS}styleId"
+W_NAME = f"{W_NS}name"
+
+# Export/API response pair used by --check
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "docx"
+FIXTURE_DOCX = FIXTURE_DIR / "glossary.docx"
+FIXTURE_DOC_JSON = FIXTURE_DIR / "doc.json"
+
+# Read size when hashing an export
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Word style names -> Docs API namedStyleType
+NAMED_STYLES = {
+    "heading 1": "HEADING_1",
+    "heading 2": "HEADING_2",
+    "heading 3": "HEADING_3",
+    "title": "TITLE",
+    "subtitle": "SUBTITLE",
+}
+
+
+def load_style_names(archive: zipfile.ZipFile) -> dict[str, str]:
+    """Map paragraph style IDs to lowercase style names from word/styles.xml."""
+    try:
+        styles_xml = archive.read("word/styles.xml")
+    except KeyError:
+        return {}
+
+    names = {}
+    for style in ET.fromstring(styles_xml).iter(W_STYLE):
+        style_id = style.get(W_STYLE_ID)
+        name = style.find(W_NAME)
+        if style_id and name is not None:
+            names[style_id] = name.get(W_VAL, "").lower()
+    return names
+
+
+def named_style_type(style_id: str, style_names: dict[str, str]) -> str:
+    """Resolve a paragraph style ID to a Docs API namedStyleType."""
+    name = style_names.get(style_id, style_id).lower()
+    # Fall back to the ID itself ("Heading1" -> "heading 1") when styles.xml lacks it
+    name = re.sub(r"^heading\s*(\d)$", r"heading \1", name)
+    return NAMED_STYLES.get(name, "NORMAL_TEXT")
+
+
+def paragraph_to_element(paragraph: ET.Element, style_names: dict[str, str]) -> dict:
+    """Convert a <w:p> element to a Docs API structural element."""
+    style_id = ""
+    ppr = paragraph.find(W_PPR)
+    if ppr is not None:
+        pstyle = ppr.find(W_PSTYLE)
+        if pstyle is not None:
+            style_id = pstyle.get(W_VAL, "")
+
+    # Only <w:t> carries visible text (<w:delText>/<w:instrText> are skipped).
+    # Line breaks become \u000b, which is how the Docs API reports them.
+    parts = []
+    for node in paragraph.iter():
+        if node.tag == W_T:
+            parts.append(node.text or "")
+        elif node.tag == W_TAB:
+            parts.append("\t")
+        elif node.tag in (W_BR, W_CR):
+            parts.append("\u000b")
+    parts.append("\n")
+
+    return {
+        "paragraph": {
+            "paragraphStyle": {"namedStyleType": named_style_type(style_id, style_names)},
+            "elements": [{"textRun": {"content": "".join(parts)}}],
+        }
+    }
+
+
+def iter_docx_elements(docx_path: Path) -> Iterator[dict]:
+    """
+    Stream top-level body paragraphs from a .docx as Docs API elements.
+
+    Tables and other non-paragraph body content are skipped, matching the
+    API parser which only looks at top-level paragraphs.
+    """
+    with zipfile.ZipFile(docx_path) as archive:
+        style_names = load_style_names(archive)
+
+        with archive.open("word/document.xml") as document_xml:
+            depth = 0
+            body = None
+            for event, elem in ET.iterparse(document_xml, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if elem.tag == W_BODY:
+                        body = elem
+                    continue
+
+                # document=1, body=2, top-level body children=3
+                if depth == 3 and body is not None:
+                    if elem.tag == W_P:
+                        yield paragraph_to_element(elem, style_names)
+                    # Drop processed content so memory doesn't grow with the export
+                    body.clear()
+                depth -= 1
+
+
+def read_docx_title(docx_path: Path) -> str:
+    """Read the document title from docProps/core.xml, falling back to the filename."""
+    with zipfile.ZipFile(docx_path) as archive:
+        try:
+            core = ET.fromstring(archive.read("docProps/core.xml"))
+        except KeyError:
+            return docx_path.stem
+    title = core.find(f"{DC_NS}title")
+    return title.text if title is not None and title.text else docx_path.stem
+
+
+def docx_revision(docx_path: Path) -> str:
+    """Revision ID for an export: a content hash, read in chunks so memory stays flat."""
+    digest = hashlib.sha256()
+    with open(docx_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return "docx:" + digest.hexdigest()[:16]
+
+
+def parse_docx(docx_path: Path, verbose: bool = False) -> list[Term]:
+    """Parse terms from a .docx export using the shared Docs parser."""
+    parser = GoogleDocsParser(verbose=verbose)
+    return parser.parse_elements(iter_docx_elements(docx_path))
+
+
+def compare_with_api(docx_path: Path, api_json_path: Path, tab_name: str) -> list[str]:
+    """
+    Parse the same document through both sources and return a list of
+    differences in the generated markdown (empty if they match).
+    """
+    doc = json.loads(api_json_path.read_text(encoding="utf-8"))
+    api_terms = {t.id: t for t in GoogleDocsParser().parse_document(doc, tab_name)}
+    docx_terms = {t.id: t for t in parse_docx(docx_path)}
+
+    differences = []
+    for term_id in sorted(api_terms.keys() | docx_terms.keys()):
+        if term_id not in docx_terms:
+            differences.append(f"{term_id}: missing from .docx")
+        elif term_id not in api_terms:
+            differences.append(f"{term_id}: missing from API document")
+        else:
+            api_term, docx_term = api_terms[term_id], docx_terms[term_id]
+            if api_term.is_completed != docx_term.is_completed:
+                differences.append(f"{term_id}: completion status differs")
+            elif api_term.to_markdown() != docx_term.to_markdown():
+                differences.append(f"{term_id}: markdown differs")
+    return differences
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse glossary terms from a .docx export.")
+    parser.add_argument("docx", type=Path, nargs="?", help="Path to the .docx export")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        metavar="DOC_JSON",
+        help="Docs API response (JSON) to compare parsed output against"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Compare the bundled fixture .docx against its Docs API response"
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Show detailed parsing information"
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        args.docx, args.compare = FIXTURE_DOCX, FIXTURE_DOC_JSON
+    elif args.docx is None:
+        parser.error("the docx argument is required unless --check is given")
+
+    if args.compare:
+        differences = compare_with_api(args.docx, args.compare, CONFIG["tab_name"])
+        if differences:
+            print(f"✗ {len(differences)} difference(s):")
+            for difference in differences:
+                print(f"  - {difference}")
+            sys.exit(1)
+        print("✓ .docx and API parsing produce identical terms")
+        return
+
+    terms = parse_docx(args.docx, verbose=args.verbose)
+    completed = [t for t in terms if t.is_completed]
+    print(f"Parsed {len(terms)} terms ({len(completed)} completed) from {args.docx}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Pre-render OpenGraph share cards for term pages.
+
+Each published term (every file in src/data/terms) gets a 1200x630 PNG
+in public/images/og/<term-id>.png showing the term name, a definition
+excerpt and its tag colors (read from src/config/tags.config.ts, the tag
+registry). Term pages reference it as their og:image and Twitter card.
+
+Cards are cached by content hash: every card is keyed on a hash of
+everything that affects its pixels (name, excerpt, tag colors, card
+layout version). The hashes are stored in public/images/og/manifest.json,
+so a sync only re-renders cards whose term or tag colors changed.
+Dirty cards are rendered in a process pool.
+
+The sync passes the whole published corpus, not just the terms in the
+current sync, so a tag recolor re-renders every card that uses the tag.
+A card is only removed once its term's markdown file is gone from
+src/data/terms. Terms that drop back to "(IN PROGRESS)" keep their page
+(the sync never deletes markdown), so they keep their card too.
+
+Usage:
+    python scripts/og_images.py --benchmark               # Full vs incremental render times
+    python scripts/og_images.py --benchmark --terms 2000  # Larger synthetic corpus
+
+Requires Pillow:
+    pip install Pillow
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from sync_glossary import CONFIG, Term
+
+# Pillow import - will be checked at runtime
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+# Configuration
+OG_CONFIG = {
+    # Output directory relative to project root
+    "output_dir": "public/images/og",
+
+    # Cache manifest (term ID -> input hash), stored in the output directory
+    "manifest_file": "manifest.json",
+
+    # Tag registry relative to project root
+    "tags_config_file": "src/config/tags.config.ts",
+
+    # Card size (standard OpenGraph image size)
+    "width": 1200,
+    "height": 630,
+
+    # Maximum definition excerpt length (characters)
+    "excerpt_length": 220,
+
+    # Worker processes (None = os.cpu_count())
+    "workers": None,
+
+    # Below this many dirty cards, render in-process (pool startup isn't worth it)
+    "min_parallel": 8,
+
+    # Markdown term files relative to project root (cards without one are removed)
+    "terms_dir": CONFIG["output_dir"],
+
+    # Bump when the card layout changes to invalidate every cached card
+    "layout_version": 1,
+}
+
+# Colors from src/app/theme.ts
+CARD_COLORS = {
+    "background": "#FAF9F6",
+    "text_primary": "#2C2C2C",
+    "text_secondary": "#6B6B6B",
+    "accent": "#E07A5F",
+}
+
+# Fallback tag color (matches getTagColor() in tags.config.ts)
+DEFAULT_TAG_COLOR = "#64748b"
+
+SITE_NAME = "League Strategic Glossary"
+
+
+def load_tag_colors(tags_config_path: Path) -> dict[str, str]:
+    """
+    Load tag colors from tags.config.ts.
+    Uses the same simple parsing approach as generate-glossary-data.ts,
+    which works because we control the format of that file.
+    """
+    if not tags_config_path.exists():
+        print(f"  ⚠️  Tags config file not found: {tags_config_path}")
+        return {}
+
+    content = tags_config_path.read_text(encoding="utf-8")
+    tags_match = re.search(r"export const TAGS: TagConfig\[\] = (\[[\s\S]*?\n\]);", content)
+    if not tags_match:
+        print("  ⚠️  Could not parse TAGS array from config file")
+        return {}
+
+    colors = {}
+    for block in re.findall(r"\{([^{}]*)\}", tags_match.group(1)):
+        id_match = re.search(r"id:\s*['\"]([^'\"]+)['\"]", block)
+        color_match = re.search(r"color:\s*['\"]([^'\"]+)['\"]", block)
+        if id_match and color_match:
+            colors[id_match.group(1)] = color_match.group(1)
+
+    return colors
+
+
+def make_excerpt(definition: str, max_length: int) -> str:
+    """Strip markdown markers and truncate the definition at a word boundary."""
+    text = re.sub(r"`([^`]+)`", r"\1", definition)
+    text = re.sub(r"[*_]+", "", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    if len(text) <= max_length:
+        return text
+    cut = text[:max_length - 3].rsplit(" ", 1)[0]
+    return cut.rstrip(",.;:") + "..."
+
+
+def build_card_job(term: Term, tag_colors: dict[str, str], output_dir: Path) -> dict:
+    """
+    Collect everything needed to render a card into a plain (picklable) dict,
+    along with the hash of those inputs.
+    """
+    job = {
+        "id": term.id,
+        "name": term.clean_name,
+        "excerpt": make_excerpt(term.definition, OG_CONFIG["excerpt_length"]),
+        "colors": [tag_colors.get(tag, DEFAULT_TAG_COLOR) for tag in term.effective_tags],
+        "size": [OG_CONFIG["width"], OG_CONFIG["height"]],
+        "layout_version": OG_CONFIG["layout_version"],
+    }
+    payload = json.dumps(job, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    job["hash"] = hashlib.sha256(payload).hexdigest()
+    job["path"] = str(output_dir / f"{term.id}.png")
+    return job
+
+
+@lru_cache(maxsize=None)
+def _load_font(size: int, bold: bool = False) -> "ImageFont.ImageFont":
+    """Load a TrueType font if one is available, falling back to Pillow's default."""
+    candidates = ["DejaVuSans-Bold.ttf", "Arial Bold.ttf"] if bold else ["DejaVuSans.ttf", "Arial.ttf"]
+    for name in candidates:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def _wrap_text(draw: "ImageDraw.ImageDraw", text: str, font, max_width: int,
+               max_lines: int) -> list[str]:
+    """Greedy word wrap, ellipsizing the last line if the text doesn't fit."""
+    lines: list[str] = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}".strip()
+        if draw.textlength(candidate, font=font) <= max_width:
+            current = candidate
+            continue
+        if current:
+            lines.append(current)
+        current = word
+        if len(lines) == max_lines:
+            lines[-1] = lines[-1].rstrip(",.;:") + "..."
+            return lines
+    if current:
+        lines.append(current)
+    return lines[:max_lines]
+
+
+def render_card(job: dict) -> str:
+    """Render one share card to job["path"]. Runs inside worker processes."""
+    width, height = job["size"]
+    margin = 72
+    image = Image.new("RGB", (width, height), CARD_COLORS["background"])
+    draw = ImageDraw.Draw(image)
+
+    # Tag color band along the top, one segment per tag
+    band_height = 16
+    segment = width / max(len(job["colors"]), 1)
+    for index, color in enumerate(job["colors"]):
+        draw.rectangle(
+            [round(index * segment), 0, round((index + 1) * segment), band_height],
+            fill=color,
+        )
+
+    # Term name
+    title_font = _load_font(72, bold=True)
+    title_lines = _wrap_text(draw, job["name"], title_font, width - 2 * margin, max_lines=2)
+    y = 96
+    for line in title_lines:
+        draw.text((margin, y), line, font=title_font, fill=CARD_COLORS["text_primary"])
+        y += 86
+
+    # Accent rule
+    y += 12
+    draw.rectangle([margin, y, margin + 120, y + 6], fill=CARD_COLORS["accent"])
+    y += 36
+
+    # Definition excerpt
+    body_font = _load_font(34)
+    for line in _wrap_text(draw, job["excerpt"], body_font, width - 2 * margin, max_lines=5):
+        draw.text((margin, y), line, font=body_font, fill=CARD_COLORS["text_secondary"])
+        y += 46
+
+    # Site branding
+    brand_font = _load_font(28, bold=True)
+    draw.text((margin, height - margin - 28), SITE_NAME, font=brand_font, fill=CARD_COLORS["accent"])
+
+    image.save(job["path"], format="PNG")
+    return job["id"]
+
+
+def load_manifest(manifest_path: Path) -> dict[str, str]:
+    """Load the card hash manifest (empty if missing or unreadable)."""
+    if not manifest_path.exists():
+        return {}
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
+def render_og_images(terms: list[Term], project_root: Path, output_dir: Optional[Path] = None,
+                     workers: Optional[int] = None, dry_run: bool = False,
+                     verbose: bool = False) -> dict[str, int]:
+    """
+    Render share cards for the given terms, skipping cards whose input hash
+    matches the manifest. Cards are removed only for terms that have no
+    markdown file left in the terms directory. workers=1 renders in-process.
+    Returns counts of rendered/cached/removed cards.
+    """
+    if output_dir is None:
+        output_dir = project_root / OG_CONFIG["output_dir"]
+    if workers is None:
+        workers = OG_CONFIG["workers"]
+    manifest_path = output_dir / OG_CONFIG["manifest_file"]
+
+    tag_colors = load_tag_colors(project_root / OG_CONFIG["tags_config_file"])
+    manifest = load_manifest(manifest_path)
+
+    jobs = [build_card_job(term, tag_colors, output_dir) for term in terms]
+    dirty = [
+        job for job in jobs
+        if manifest.get(job["id"]) != job["hash"] or not Path(job["path"]).exists()
+    ]
+    current_ids = {job["id"] for job in jobs}
+    terms_dir = project_root / OG_CONFIG["terms_dir"]
+    stale_ids = [
+        term_id for term_id in manifest
+        if term_id not in current_ids and not (terms_dir / f"{term_id}.md").exists()
+    ]
+
+    stats = {"rendered": len(dirty), "cached": len(jobs) - len(dirty), "removed": len(stale_ids)}
+    if dry_run:
+        return stats
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if workers != 1 and len(dirty) >= OG_CONFIG["min_parallel"]:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(dirty) // ((workers or os.cpu_count() or 1) * 4))
+            for term_id in pool.map(render_card, dirty, chunksize=chunksize):
+                if verbose:
+                    print(f"  ✓ {term_id}.png")
+    else:
+        for job in dirty:
+            render_card(job)
+            if verbose:
+                print(f"  ✓ {job['id']}.png")
+
+    for term_id in stale_ids:
+        (output_dir / f"{term_id}.png").unlink(missing_ok=True)
+
+    # Cards kept for terms outside this sync keep their last hash
+    removed = set(stale_ids)
+    new_manifest = {term_id: card_hash for term_id, card_hash in manifest.items() if term_id not in removed}
+    new_manifest.update((job["id"], job["hash"]) for job in jobs)
+    manifest_path.write_text(json.dumps(new_manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    return stats
+
+
+def _synthetic_terms(count: int) -> list[Term]:
+    """Generate a synthetic corpus for benchmarking."""
+    sections = ["Strategy", "Vernacular", "Game Mechanics", "Abstract Concepts"]
+    extra_tags = ["economy", "vision", "minions", "jungle", "item"]
+    words = ("wave lane pressure tempo vision objective jungle gank trade "
+             "recall item gold priority rotation fight").split()
+    terms = []
+    for i in range(count):
+        term = Term(f"Synthetic Term {i} ✓", sections[i % len(sections)])
+        term.tags = [extra_tags[i % len(extra_tags)]] if i % 3 == 0 else []
+        term.definition_lines = [" ".join(words[(i + j) % len(words)] for j in range(60))]
+        term.is_completed = True
+        terms.append(term)
+    return terms
+
+
+def run_benchmark(count: int, workers: Optional[int]):
+    """Benchmark full-corpus and incremental render times on a synthetic corpus."""
+    project_root = Path(__file__).parent.parent
+    terms = _synthetic_terms(count)
+    tmp_dir = Path(tempfile.mkdtemp(prefix="og-bench-"))
+
+    try:
+        output_dir = tmp_dir / "og"
+        tags_path = tmp_dir / "src" / "config" / "tags.config.ts"
+        tags_path.parent.mkdir(parents=True)
+        shutil.copy(project_root / OG_CONFIG["tags_config_file"], tags_path)
+
+        def timed(label: str, **kwargs):
+            start = time.perf_counter()
+            stats = render_og_images(terms, tmp_dir, output_dir=output_dir, **kwargs)
+            elapsed = time.perf_counter() - start
+            print(f"  {label:<32} {elapsed:8.2f}s  rendered={stats['rendered']} cached={stats['cached']}")
+
+        print(f"Benchmarking OG card rendering ({count} terms)")
+        timed("full (in-process)", workers=1)
+        shutil.rmtree(output_dir)
+        timed(f"full (pool, workers={workers or os.cpu_count()})", workers=workers)
+        timed("incremental (no changes)", workers=workers)
+
+        # One definition edit
+        terms[0].definition_lines = ["An edited definition."]
+        timed("incremental (1 term edited)", workers=workers)
+
+        # One tag color change re-renders every card using that tag
+        content = tags_path.read_text(encoding="utf-8")
+        tags_path.write_text(content.replace("#f59e0b", "#eab308"), encoding="utf-8")
+        timed("incremental (economy recolored)", workers=workers)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render OpenGraph share cards for term pages.")
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Benchmark full-corpus and incremental render times on a synthetic corpus"
+    )
+    parser.add_argument(
+        "--terms",
+        type=int,
+        default=500,
+        help="Synthetic corpus size for --benchmark (default: 500)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)"
+    )
+    args = parser.parse_args()
+
+    if not PIL_AVAILABLE:
+        print("Error: Pillow not installed.")
+        print("\nInstall with:")
+        print("  pip install Pillow")
+        raise SystemExit(1)
+
+    if args.benchmark:
+        run_benchmark(args.terms, args.workers)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Section-parallel parsing for very large glossary documents.
+
+GoogleDocsParser walks every structural element in one process. For big
+documents this splits the tab's content into chunks at section (Heading 1)
+boundaries and parses the chunks in a process pool, then merges the terms
+back in document order.
+
+Chunk boundaries:
+    A Heading 1 doesn't end the current term in the sequential parser -
+    paragraphs between a Heading 1 and the next Heading 2 still belong to
+    the previous term's definition. So each chunk starts at the *first
+    Heading 2 after a Heading 1*, where parser state is fully reset except
+    for the current section, which is passed to the chunk explicitly. This
+    keeps the output identical to the sequential parser.
+
+Small documents are parsed sequentially. Sequential parsing costs a few
+microseconds per element; a parallel run adds pool startup, a serial
+split_sections() pass, and unpickling every parsed term in the parent
+(as flat tuples, which is several times cheaper than pickling Term
+objects). Below PARALLEL_PARSE_CONFIG["min_elements"] that overhead
+outweighs the parsing saved, and with fewer than ["min_workers"] cores
+the pool never catches up.
+
+--benchmark measures each of those costs and prints the projected
+crossover (the element count where parallel parsing starts to win) for
+the available cores; re-tune min_elements from it on the sync machine.
+
+Usage:
+    python scripts/parallel_parse.py --benchmark                  # Sequential vs parallel
+    python scripts/parallel_parse.py --benchmark --terms 50000
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from sync_glossary import GoogleDocsParser, Term
+
+
+# Configuration
+PARALLEL_PARSE_CONFIG = {
+    # Minimum number of structural elements before parallel parsing is used.
+    # From the measured costs in --benchmark (per element: sequential
+    # ~2.7us, split ~0.5us, pickle ~0.2us, unpickle ~0.3us; pool startup
+    # 16-36ms for 3 workers) the projected break-even with 3 cores is
+    # 20k-40k elements, assuming perfect scaling. At 150k the projection
+    # is ~25% faster than sequential, leaving room for imperfect scaling
+    # and copy-on-write faults in workers
+    "min_elements": 150_000,
+
+    # Minimum number of section chunks before parallel parsing is used
+    "min_chunks": 2,
+
+    # Minimum number of workers before parallel parsing is used. Shipping
+    # terms back costs roughly half of what parsing them does, so two
+    # workers barely break even (see --benchmark)
+    "min_workers": 3,
+
+    # Worker processes (None = os.cpu_count())
+    "workers": None,
+}
+
+# Content list inherited by forked workers, so chunks are passed as index
+# ranges instead of pickling every element
+_SHARED_CONTENT: list[dict] = []
+
+
+def split_sections(content: list[dict]) -> list[tuple[int, int, str]]:
+    """
+    Split content into (start, end, section) chunks.
+
+    Each chunk after the first starts at the first Heading 2 following a
+    Heading 1; `section` is the Heading 1 in effect at the chunk start.
+    Headings with blank text are ignored, as in the sequential parser.
+    """
+    extract_text = GoogleDocsParser()._extract_text
+    chunks = []
+    start = 0
+    start_section = "uncategorized"
+    section = "uncategorized"
+    pending_boundary = False
+
+    for index, element in enumerate(content):
+        paragraph = element.get("paragraph")
+        if paragraph is None:
+            continue
+        style = paragraph.get("paragraphStyle", {}).get("namedStyleType", "")
+        if style not in ("HEADING_1", "HEADING_2"):
+            continue
+        text = extract_text(paragraph)
+        if not text.strip():
+            continue
+
+        if style == "HEADING_1":
+            section = text.strip()
+            pending_boundary = True
+        elif pending_boundary:
+            if index > start:
+                chunks.append((start, index, start_section))
+            start = index
+            start_section = section
+            pending_boundary = False
+
+    chunks.append((start, len(content), start_section))
+    return chunks
+
+
+def should_parallelize(content: list[dict], workers: Optional[int]) -> bool:
+    """
+    Crossover heuristic: only large docs on machines with enough cores are
+    worth a pool. Checked before splitting so small docs pay nothing extra.
+    Workers beyond the number of cores don't add parallelism, so they
+    don't count towards min_workers.
+    """
+    cores = os.cpu_count() or 1
+    worker_count = min(workers or cores, cores)
+    return (
+        worker_count >= PARALLEL_PARSE_CONFIG["min_workers"]
+        and len(content) >= PARALLEL_PARSE_CONFIG["min_elements"]
+    )
+
+
+def _term_to_state(term: Term) -> tuple:
+    """Flatten a term to a tuple - several times cheaper to pickle than the object."""
+    return (term.name, term.section, term.alternates, term.tags, term.links,
+            term.definition_lines, term.is_completed, term.is_in_progress)
+
+
+def _term_from_state(state: tuple) -> Term:
+    """Rebuild a term from _term_to_state() output."""
+    name, section, alternates, tags, links, definition_lines, is_completed, is_in_progress = state
+    term = Term(name, section)
+    term.alternates = alternates
+    term.tags = tags
+    term.links = links
+    term.definition_lines = definition_lines
+    term.is_completed = is_completed
+    term.is_in_progress = is_in_progress
+    return term
+
+
+def _parse_chunk(chunk: tuple) -> list[tuple]:
+    """Parse one chunk in a worker. Accepts (start, end, section) or (elements, section)."""
+    if len(chunk) == 3:
+        start, end, section = chunk
+        elements = _SHARED_CONTENT[start:end]
+    else:
+        elements, section = chunk
+    terms = GoogleDocsParser().parse_elements(elements, section=section)
+    return [_term_to_state(term) for term in terms]
+
+
+def _uses_fork() -> bool:
+    """
+    Whether the pool forks. Only where fork is the platform default (Linux):
+    macOS lists fork too, but forking a parent that has loaded system
+    frameworks and made HTTPS calls (google-auth, ssl) isn't safe there.
+    """
+    return multiprocessing.get_start_method() == "fork"
+
+
+def parse_content_parallel(content: list[dict], chunks: list[tuple[int, int, str]],
+                           workers: Optional[int] = None) -> list[Term]:
+    """Parse chunks in a process pool and merge terms in document order."""
+    global _SHARED_CONTENT
+
+    # With fork, workers inherit the content list; otherwise ship each chunk's elements
+    context = multiprocessing.get_context()
+    if _uses_fork():
+        _SHARED_CONTENT = content
+        jobs = chunks
+    else:
+        jobs = [(content[start:end], section) for start, end, section in chunks]
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            terms = []
+            for chunk_states in pool.map(_parse_chunk, jobs):
+                terms.extend(_term_from_state(state) for state in chunk_states)
+            return terms
+    finally:
+        _SHARED_CONTENT = []
+
+
+def parse_document(doc: dict, tab_name: str, verbose: bool = False,
+                   parallel: Optional[bool] = None, workers: Optional[int] = None) -> list[Term]:
+    """
+    Parse a document, choosing sequential or section-parallel parsing.
+
+    parallel=None applies the crossover heuristic; True/False force a mode.
+    Verbose runs are always sequential so the parse log stays in order.
+    """
+    if workers is None:
+        workers = PARALLEL_PARSE_CONFIG["workers"]
+
+    parser = GoogleDocsParser(verbose=verbose)
+    content = parser.find_content(doc, tab_name)
+
+    if verbose or parallel is False:
+        return parser.parse_elements(content)
+
+    if parallel is None and not should_parallelize(content, workers):
+        return parser.parse_elements(content)
+
+    chunks = split_sections(content)
+    if parallel is None and len(chunks) < PARALLEL_PARSE_CONFIG["min_chunks"]:
+        return parser.parse_elements(content)
+
+    return parse_content_parallel(content, chunks, workers)
+
+
+def _synthetic_document(term_count: int, terms_per_section: int = 50) -> dict:
+    """Build a Docs API-shaped document for benchmarking."""
+    def paragraph(text: str, style: str = "NORMAL_TEXT") -> dict:
+        return {"paragraph": {"paragraphStyle": {"namedStyleType": style},
+                              "elements": [{"textRun": {"content": text + "\n"}}]}}
+
+    sentence = "Trading in lane depends on wave state, cooldowns and jungle proximity."
+    content = [{"sectionBreak": {}}]
+    for i in range(term_count):
+        if i % terms_per_section == 0:
+            content.append(paragraph(f"Section {i // terms_per_section}", "HEADING_1"))
+            content.append(paragraph(""))
+        content.append(paragraph(f"Term {i} ✓" if i % 5 else f"Term {i} (IN PROGRESS)", "HEADING_2"))
+        content.append(paragraph(f"Also known as: alt {i}, other {i}"))
+        content.append(paragraph(f"See also: Term {(i + 1) % term_count}"))
+        content.append(paragraph(""))
+        for _ in range(4):
+            content.append(paragraph(sentence))
+        content.append(paragraph(""))
+    return {"title": "Benchmark", "body": {"content": content}}
+
+
+def _best_time(fn, repeat: int = 3) -> float:
+    """Best wall time of a few runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure_costs(content: list[dict], worker_counts: list[int]) -> dict:
+    """
+    Measure the parts of a parallel parse separately: sequential parsing,
+    splitting, pickling terms in workers, unpickling them in the parent
+    (all per element, in seconds) and pool startup for each worker count
+    ({workers: seconds}).
+    """
+    import pickle
+
+    count = len(content)
+    terms = GoogleDocsParser().parse_elements(content)
+    chunks = split_sections(content)
+    per_chunk = max(1, len(terms) // len(chunks))
+
+    def pickle_chunks() -> list[bytes]:
+        return [pickle.dumps([_term_to_state(t) for t in terms[i:i + per_chunk]])
+                for i in range(0, len(terms), per_chunk)]
+
+    blobs = pickle_chunks()
+
+    def startup(workers: int):
+        context = multiprocessing.get_context()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            list(pool.map(abs, range(workers)))
+
+    return {
+        "sequential": _best_time(lambda: GoogleDocsParser().parse_elements(content)) / count,
+        "split": _best_time(lambda: split_sections(content)) / count,
+        "pickle": _best_time(pickle_chunks) / count,
+        "unpickle": _best_time(lambda: [_term_from_state(state) for blob in blobs
+                                        for state in pickle.loads(blob)]) / count,
+        "startup": {workers: _best_time(lambda: startup(workers)) for workers in worker_counts},
+    }
+
+
+def projected_crossover(costs: dict[str, float], workers: int) -> Optional[int]:
+    """
+    Element count where a parallel parse with `workers` cores is projected
+    to beat a sequential one (None if it never does). Assumes workers
+    scale perfectly, so treat it as a lower bound.
+    """
+    saved = costs["sequential"] - costs["split"] - costs["unpickle"] \
+        - (costs["sequential"] + costs["pickle"]) / workers
+    if saved <= 0:
+        return None
+    return int(costs["startup"][workers] / saved)
+
+
+def run_benchmark(term_count: int, workers: Optional[int]):
+    """Benchmark sequential vs parallel parsing and check the outputs are identical."""
+    doc = _synthetic_document(term_count)
+    content = doc["body"]["content"]
+    chunks = split_sections(content)
+    print(f"Benchmarking parse ({term_count} terms, {len(content)} elements, {len(chunks)} sections)")
+
+    def timed(label: str, **kwargs) -> list[Term]:
+        start = time.perf_counter()
+        terms = parse_document(doc, "missing-tab", **kwargs)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<36} {elapsed:8.3f}s")
+        return terms
+
+    cores = os.cpu_count() or 1
+    sequential = timed("sequential", parallel=False)
+    parallel = timed(f"parallel (workers={workers or cores}, cores={cores})", parallel=True, workers=workers)
+    auto = timed("auto (crossover heuristic)", workers=workers)
+
+    for terms in (parallel, auto):
+        if [t.to_markdown() for t in terms] != [t.to_markdown() for t in sequential] or \
+                [t.is_completed for t in terms] != [t.is_completed for t in sequential]:
+            raise SystemExit("✗ Parallel output differs from sequential output")
+    print("  ✓ Parallel output identical to sequential")
+
+    worker_counts = sorted({PARALLEL_PARSE_CONFIG["min_workers"], 4, 8, cores})
+    costs = measure_costs(content, worker_counts)
+    print("Measured costs (per element unless noted)")
+    for name in ("sequential", "split", "pickle", "unpickle"):
+        print(f"  {name:<36} {costs[name] * 1e6:8.2f}us")
+    for worker_count in worker_counts:
+        print(f"  {f'pool startup ({worker_count} workers)':<36} {costs['startup'][worker_count] * 1e3:8.1f}ms")
+
+    print(f"Projected crossover (min_elements is {PARALLEL_PARSE_CONFIG['min_elements']})")
+    for worker_count in worker_counts:
+        crossover = projected_crossover(costs, worker_count)
+        label = f"{worker_count} cores" + (" (this machine)" if worker_count == cores else "")
+        print(f"  {label:<36} " + (f"{crossover:>8} elements" if crossover is not None else "   never"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Section-parallel glossary document parsing.")
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Benchmark sequential vs parallel parsing on a synthetic document"
+    )
+    parser.add_argument(
+        "--terms",
+        type=int,
+        default=20_000,
+        help="Synthetic document size in terms for --benchmark (default: 20000)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)"
+    )
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.terms, args.workers)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
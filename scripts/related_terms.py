@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Suggest related terms to augment hand-curated "See also" links.
+
+Builds TF-IDF vectors over each term's name, alternates and definition as
+a sparse matrix, computes cosine similarity for all pairs in batched
+sparse-times-sparse products, and keeps the top-k neighbours per term that
+aren't already linked (manual links or autoLinks).
+
+During a sync, suggestions cover the published corpus (every file in
+src/data/terms), so a partial or offline export doesn't shrink the report.
+
+Suggestions are a report, not links: they're written to
+src/data/relatedSuggestions.json for editors to review and promote into
+"See also:" lines in the doc. Markdown files are never changed.
+
+Output format:
+    {
+      "term-id": [{"id": "other-term", "score": 0.4213}, ...],
+      ...
+    }
+
+Results are deterministic: vocabulary and term order are sorted, and ties
+are broken by term ID.
+
+Usage:
+    python scripts/related_terms.py                         # Suggestions for src/data/terms
+    python scripts/related_terms.py --benchmark --terms 10000
+
+Requires NumPy and SciPy:
+    pip install numpy scipy
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from shuffle_tables import build_adjacency
+from sync_glossary import Term
+
+# NumPy/SciPy imports - will be checked at runtime
+try:
+    import numpy as np
+    from scipy import sparse
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Configuration
+RELATED_CONFIG = {
+    # Output file relative to project root
+    "output_file": "src/data/relatedSuggestions.json",
+
+    # Suggestions kept per term
+    "top_k": 5,
+
+    # Minimum cosine similarity for a suggestion
+    "min_score": 0.1,
+
+    # How many times name / alternate tokens are counted relative to definition tokens
+    "name_weight": 3,
+    "alternate_weight": 2,
+
+    # Rows per similarity batch (bounds the dense batch x terms block in memory)
+    "batch_size": 512,
+}
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Common English words that carry no topical signal
+STOPWORDS = frozenset("""
+a about after again against all also an and any are as at be because been
+before being between both but by can could did do does doing down during each
+few for from further had has have having he her here hers him his how i if in
+into is it its itself just more most no nor not of off on once only or other
+our out over own same she should so some such than that the their them then
+there these they this those through to too under until up very was we were
+what when where which while who whom why will with would you your
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens with stopwords, backticks and markdown markers removed."""
+    return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def term_tokens(term: Term) -> list[str]:
+    """Weighted token list for a term: name and alternates count extra."""
+    tokens = tokenize(term.clean_name) * RELATED_CONFIG["name_weight"]
+    for alternate in term.alternates:
+        tokens += tokenize(alternate) * RELATED_CONFIG["alternate_weight"]
+    tokens += tokenize(term.definition)
+    return tokens
+
+
+def build_tfidf_matrix(documents: list[list[str]]) -> "sparse.csr_matrix":
+    """
+    Build an L2-normalized TF-IDF matrix (documents x vocabulary).
+    Uses sublinear term frequency (1 + log tf) and smoothed IDF.
+    """
+    vocabulary = {token: index for index, token in enumerate(sorted({t for doc in documents for t in doc}))}
+
+    indptr = [0]
+    indices: list[int] = []
+    counts: list[int] = []
+    for doc in documents:
+        doc_counts: dict[int, int] = {}
+        for token in doc:
+            column = vocabulary[token]
+            doc_counts[column] = doc_counts.get(column, 0) + 1
+        for column in sorted(doc_counts):
+            indices.append(column)
+            counts.append(doc_counts[column])
+        indptr.append(len(indices))
+
+    shape = (len(documents), len(vocabulary))
+    tf = sparse.csr_matrix(
+        (1.0 + np.log(np.asarray(counts, dtype=np.float64)),
+         np.asarray(indices, dtype=np.int64),
+         np.asarray(indptr, dtype=np.int64)),
+        shape=shape,
+    )
+
+    document_frequency = np.bincount(tf.indices, minlength=shape[1])
+    idf = np.log((1.0 + shape[0]) / (1.0 + document_frequency)) + 1.0
+    tfidf = tf.multiply(idf).tocsr()
+
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms).dot(tfidf).tocsr()
+
+
+def top_k_neighbors(matrix: "sparse.csr_matrix", excluded: list[set[int]], k: int,
+                    min_score: float, batch_size: int) -> list[list[tuple[int, float]]]:
+    """
+    Top-k most similar rows for every row, skipping self and excluded rows.
+    Similarities are computed one batch of rows at a time against all rows.
+    Scores are compared rounded to 6 digits and ties are broken by row
+    index, so results are deterministic.
+    """
+    n = matrix.shape[0]
+    transposed = matrix.T.tocsr()
+    results: list[list[tuple[int, float]]] = []
+
+    for start in range(0, n, batch_size):
+        stop = min(start + batch_size, n)
+        scores = (matrix[start:stop] @ transposed).toarray()
+
+        # Mask self-similarity and existing links
+        rows = np.arange(stop - start)
+        scores[rows, np.arange(start, stop)] = -1.0
+        for offset, row in enumerate(range(start, stop)):
+            if excluded[row]:
+                scores[offset, list(excluded[row])] = -1.0
+
+        kth = min(k, n - 1)
+        if kth <= 0:
+            results.extend([] for _ in range(stop - start))
+            continue
+
+        # Round before ordering so float noise can't reorder near-ties
+        rounded = np.round(scores, 6)
+        # Partial sort finds the k-th best score per row; argpartition picks
+        # arbitrarily among entries tied with it, so every entry scoring at
+        # least that much is kept as a candidate before the full sort
+        partitioned = np.argpartition(-rounded, kth - 1, axis=1)[:, :kth]
+        kth_scores = rounded[np.arange(stop - start)[:, None], partitioned].min(axis=1)
+        for offset in range(stop - start):
+            row_scores = scores[offset]
+            row_candidates = np.flatnonzero(
+                (rounded[offset] >= kth_scores[offset]) & (row_scores >= min_score)
+            )
+            order = np.lexsort((row_candidates, -rounded[offset, row_candidates]))[:k]
+            results.append([
+                (int(row_candidates[i]), float(row_scores[row_candidates[i]])) for i in order
+            ])
+
+    return results
+
+
+def suggest_related_terms(terms: list[Term], top_k: Optional[int] = None,
+                          min_score: Optional[float] = None) -> dict[str, list[dict[str, Union[str, float]]]]:
+    """
+    Suggest up to top_k related terms per term that aren't already linked.
+    Returns {term_id: [{"id": ..., "score": ...}, ...]} for terms with suggestions.
+    """
+    if top_k is None:
+        top_k = RELATED_CONFIG["top_k"]
+    if min_score is None:
+        min_score = RELATED_CONFIG["min_score"]
+
+    ordered = sorted(terms, key=lambda t: t.id)
+    if len(ordered) < 2:
+        return {}
+
+    ids = [term.id for term in ordered]
+    index_of = {term_id: index for index, term_id in enumerate(ids)}
+
+    # Existing connections in either direction (manual links + autoLinks)
+    adjacency = build_adjacency(ordered)
+    excluded: list[set[int]] = [set() for _ in ids]
+    for source, targets in adjacency.items():
+        for target in targets:
+            excluded[index_of[source]].add(index_of[target])
+            excluded[index_of[target]].add(index_of[source])
+
+    matrix = build_tfidf_matrix([term_tokens(term) for term in ordered])
+    neighbors = top_k_neighbors(matrix, excluded, top_k, min_score, RELATED_CONFIG["batch_size"])
+
+    suggestions = {}
+    for term_id, term_neighbors in zip(ids, neighbors):
+        if term_neighbors:
+            suggestions[term_id] = [
+                {"id": ids[index], "score": round(score, 4)} for index, score in term_neighbors
+            ]
+    return suggestions
+
+
+def write_suggestions(suggestions: dict, output_path: Path):
+    """Write suggestions as JSON (sorted keys for stable diffs)."""
+    output_path.write_text(json.dumps(suggestions, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _synthetic_terms(count: int, seed: int = 0) -> list[Term]:
+    """Generate a synthetic corpus with topical clusters for benchmarking."""
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(20_000)]
+    topics = [rng.sample(vocabulary, 200) for _ in range(max(count // 25, 1))]
+    terms = []
+    for i in range(count):
+        topic = topics[i % len(topics)]
+        words = rng.choices(topic, k=60) + rng.choices(vocabulary, k=20)
+        term = Term(f"Synthetic Term {i}", "Strategy")
+        term.definition_lines = [" ".join(words)]
+        if i % 4 == 0:
+            term.links = [Term.normalize_to_id(f"Synthetic Term {(i + 25) % count}")]
+        terms.append(term)
+    return terms
+
+
+def run_benchmark(count: int):
+    """Benchmark suggestion generation on a synthetic corpus and check determinism."""
+    terms = _synthetic_terms(count)
+    print(f"Benchmarking related-term suggestions ({count} terms)")
+
+    timings = []
+    results = []
+    for _ in range(2):
+        start = time.perf_counter()
+        results.append(suggest_related_terms(terms))
+        timings.append(time.perf_counter() - start)
+
+    suggested = sum(len(s) for s in results[0].values())
+    print(f"  run 1: {timings[0]:.2f}s, run 2: {timings[1]:.2f}s ({suggested} suggestions)")
+    if json.dumps(results[0], sort_keys=True) != json.dumps(results[1], sort_keys=True):
+        raise SystemExit("✗ Suggestions differ between runs")
+    print("  ✓ Deterministic across runs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suggest related terms for \"See also\" links.")
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Benchmark on a synthetic corpus"
+    )
+    parser.add_argument(
+        "--terms",
+        type=int,
+        default=10_000,
+        help="Synthetic corpus size for --benchmark (default: 10000)"
+    )
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("Error: NumPy and SciPy not installed.")
+        print("\nInstall with:")
+        print("  pip install numpy scipy")
+        raise SystemExit(1)
+
+    if args.benchmark:
+        run_benchmark(args.terms)
+        return
+
+    from term_corpus import load_corpus_terms
+
+    terms = load_corpus_terms()
+    names = {term.id: term.clean_name for term in terms}
+    suggestions = suggest_related_terms(terms)
+    adjacency = build_adjacency(terms)
+    dead_ends = {term_id for term_id, targets in adjacency.items() if not targets}
+
+    print(f"Suggestions for {len(suggestions)} of {len(terms)} terms")
+    for term_id, related in suggestions.items():
+        marker = " (dead end)" if term_id in dead_ends else ""
+        related_str = ", ".join(f"{names[r['id']]} ({r['score']:.2f})" for r in related)
+        print(f"  {names[term_id]}{marker}: {related_str}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Precompute Explore-mode shuffle tables for the glossary.
+
+The shuffle button in Explore mode picks a random term that has at least
+SHUFFLE_CONFIG.minConnections connections (links + autoLinks). Instead of
+recounting connections and sampling uniformly on every click, the sync step
+precomputes:
+
+    - Eligibility sets for a range of minConnections thresholds
+    - Alias-method sampling tables for each weight scheme, so a weighted
+      random pick is O(1): one index draw plus one coin flip
+
+Output format (JSON, compact arrays):
+    {
+      "ids": ["term-a", "term-b", ...],
+      "degrees": [3, 1, ...],
+      "thresholds": {
+        "2": {
+          "members": [0, 4, 7],             <- indices into "ids"
+          "tables": {
+            "degree": {"prob": [...], "alias": [...]}   <- alias holds indices into "ids"
+          }
+        }
+      }
+    }
+
+    To sample with threshold t and scheme s:
+        i = floor(random() * members.length)
+        pick = random() < prob[i] ? members[i] : alias[i]
+
+Weight schemes:
+    - uniform:        every eligible term equally likely (current behavior)
+    - degree:         proportional to connection count (favors hub terms)
+    - centrality:     proportional to PageRank over the link graph
+    - inverse-degree: favors terms that few other terms link to (under-visited)
+
+Usage:
+    python scripts/shuffle_tables.py --check    # Verify sampling distribution
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+from pathlib import Path
+from typing import Callable, Optional
+
+from sync_glossary import Term
+
+
+# ASCII word runs, matching what \b sees with re.ASCII
+WORD_RE = re.compile(r"\w+", re.ASCII)
+
+BACKTICK_RE = re.compile(r"`[^`]+`")
+
+# Configuration
+SHUFFLE_TABLES_CONFIG = {
+    # Output file relative to project root
+    "output_file": "src/data/shuffleTables.json",
+
+    # minConnections thresholds to precompute (inclusive range)
+    "min_threshold": 0,
+    "max_threshold": 5,
+
+    # Weight schemes to emit tables for
+    "schemes": ["uniform", "degree", "centrality", "inverse-degree"],
+
+    # Digits kept for alias probabilities (keeps the JSON small)
+    "precision": 6,
+}
+
+
+def strip_backtick_content(text: str) -> str:
+    """
+    Remove text wrapped in backticks (escape mechanism for autolinking).
+    Mirrors stripBacktickContent() in generate-glossary-data.ts.
+    """
+    return BACKTICK_RE.sub("", text)
+
+
+def detect_auto_links(terms: list[Term]) -> dict[str, list[str]]:
+    """
+    Detect mentions of other terms in each term's definition.
+
+    Mirrors detectAutoLinks() in generate-glossary-data.ts: whole-word,
+    case-insensitive matching on term names and alternates, skipping
+    self-links, manual links and backtick-escaped text.
+
+    Instead of testing every (term, other term) pair, each name/alternate
+    is indexed by one of its words; a definition only runs the regexes of
+    forms whose words all appear in it. Patterns are compiled on first use.
+    """
+    # form word -> [(term index, form words, form)]
+    form_index: dict[str, list[tuple[int, frozenset, str]]] = {}
+    # Forms with no word characters can't be indexed - always check them
+    unindexed: list[tuple[int, frozenset, str]] = []
+    patterns: dict[str, re.Pattern] = {}
+
+    for index, term in enumerate(terms):
+        for form in [term.clean_name] + term.alternates:
+            words = frozenset(WORD_RE.findall(form.lower()))
+            entry = (index, words, form)
+            if words:
+                form_index.setdefault(max(words, key=len), []).append(entry)
+            else:
+                unindexed.append(entry)
+
+    auto_links: dict[str, list[str]] = {}
+    for term in terms:
+        definition = strip_backtick_content(term.definition)
+        definition_words = set(WORD_RE.findall(definition.lower()))
+
+        candidates = list(unindexed)
+        for word in definition_words:
+            candidates.extend(form_index.get(word, ()))
+
+        matched: set[int] = set()
+        for index, words, form in candidates:
+            if index in matched or not words <= definition_words:
+                continue
+            other = terms[index]
+            if other.id == term.id or other.id in term.links:
+                continue
+            pattern = patterns.get(form)
+            if pattern is None:
+                pattern = re.compile(rf"\b{re.escape(form)}\b", re.IGNORECASE | re.ASCII)
+                patterns[form] = pattern
+            if pattern.search(definition):
+                matched.add(index)
+
+        if matched:
+            # Same order as the pairwise scan (term list order)
+            auto_links[term.id] = [terms[index].id for index in sorted(matched)]
+
+    return auto_links
+
+
+def build_adjacency(terms: list[Term]) -> dict[str, list[str]]:
+    """Build the outgoing link graph (manual links + auto links) keyed by term ID."""
+    auto_links = detect_auto_links(terms)
+    known_ids = {term.id for term in terms}
+    return {
+        term.id: [target for target in term.links + auto_links.get(term.id, []) if target in known_ids]
+        for term in terms
+    }
+
+
+def pagerank(adjacency: dict[str, list[str]], damping: float = 0.85,
+             iterations: int = 100, tolerance: float = 1e-10) -> dict[str, float]:
+    """Compute PageRank scores over the link graph using power iteration."""
+    nodes = list(adjacency)
+    n = len(nodes)
+    if n == 0:
+        return {}
+
+    rank = {node: 1.0 / n for node in nodes}
+    for _ in range(iterations):
+        # Dangling nodes (no outgoing links) spread their rank evenly
+        dangling = sum(rank[node] for node in nodes if not adjacency[node])
+        base = (1.0 - damping) / n + damping * dangling / n
+        next_rank = {node: base for node in nodes}
+        for node in nodes:
+            targets = adjacency[node]
+            if targets:
+                share = damping * rank[node] / len(targets)
+                for target in targets:
+                    next_rank[target] += share
+        delta = sum(abs(next_rank[node] - rank[node]) for node in nodes)
+        rank = next_rank
+        if delta < tolerance:
+            break
+
+    return rank
+
+
+def build_alias_table(weights: list[float]) -> tuple[list[float], list[int]]:
+    """
+    Build a Vose alias table for the given weights.
+
+    Returns (prob, alias) where slot i keeps itself with probability prob[i]
+    and otherwise yields alias[i]. Indices are positions in `weights`.
+    """
+    n = len(weights)
+    if n == 0:
+        return [], []
+
+    total = sum(weights)
+    if total <= 0:
+        # Degenerate weights - fall back to uniform
+        return [1.0] * n, list(range(n))
+
+    scaled = [w * n / total for w in weights]
+    prob = [0.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = (scaled[l] + scaled[s]) - 1.0
+        if scaled[l] < 1.0:
+            small.append(l)
+        else:
+            large.append(l)
+
+    # Leftovers are 1.0 up to floating point error
+    for i in large + small:
+        prob[i] = 1.0
+
+    return prob, alias
+
+
+def sample_alias(members: list[int], prob: list[float], alias: list[int],
+                 rng: random.Random) -> int:
+    """Draw one index from an emitted table in O(1) (same logic as the client)."""
+    i = int(rng.random() * len(members))
+    return members[i] if rng.random() < prob[i] else alias[i]
+
+
+def compute_weights(scheme: str, ids: list[str], degrees: list[int],
+                    centrality: dict[str, float]) -> list[float]:
+    """Compute raw per-term weights for a weight scheme."""
+    schemes: dict[str, Callable[[int], float]] = {
+        "uniform": lambda i: 1.0,
+        "degree": lambda i: float(degrees[i]),
+        "centrality": lambda i: centrality.get(ids[i], 0.0),
+        "inverse-degree": lambda i: 1.0 / (1 + degrees[i]),
+    }
+    if scheme not in schemes:
+        raise ValueError(f"Unknown weight scheme '{scheme}'. Available: {list(schemes)}")
+    weight = schemes[scheme]
+    return [weight(i) for i in range(len(ids))]
+
+
+def build_shuffle_tables(terms: list[Term], thresholds: Optional[list[int]] = None,
+                         schemes: Optional[list[str]] = None) -> dict:
+    """
+    Build eligibility sets and alias tables for the given terms.
+
+    Degree counts links + autoLinks, matching the runtime check in
+    GlossaryGraph.tsx. If no term meets a threshold, all terms are eligible
+    (same fallback as the client).
+    """
+    if thresholds is None:
+        thresholds = list(range(SHUFFLE_TABLES_CONFIG["min_threshold"],
+                                SHUFFLE_TABLES_CONFIG["max_threshold"] + 1))
+    if schemes is None:
+        schemes = SHUFFLE_TABLES_CONFIG["schemes"]
+    precision = SHUFFLE_TABLES_CONFIG["precision"]
+
+    # Sort by ID so output is stable across syncs
+    ordered = sorted(terms, key=lambda t: t.id)
+    ids = [term.id for term in ordered]
+    adjacency = build_adjacency(ordered)
+    degrees = [len(adjacency[term_id]) for term_id in ids]
+    centrality = pagerank(adjacency) if "centrality" in schemes else {}
+
+    weights_by_scheme = {
+        scheme: compute_weights(scheme, ids, degrees, centrality) for scheme in schemes
+    }
+
+    result_thresholds = {}
+    for threshold in thresholds:
+        members = [i for i, degree in enumerate(degrees) if degree >= threshold]
+        if not members:
+            members = list(range(len(ids)))
+
+        tables = {}
+        for scheme in schemes:
+            weights = [weights_by_scheme[scheme][i] for i in members]
+            prob, alias = build_alias_table(weights)
+            tables[scheme] = {
+                "prob": [round(p, precision) for p in prob],
+                # Store aliases as indices into "ids" so the client needs no extra lookup
+                "alias": [members[a] for a in alias],
+            }
+
+        result_thresholds[str(threshold)] = {"members": members, "tables": tables}
+
+    return {"ids": ids, "degrees": degrees, "thresholds": result_thresholds}
+
+
+def write_shuffle_tables(tables: dict, output_path: Path):
+    """Write shuffle tables as compact JSON."""
+    output_path.write_text(json.dumps(tables, separators=(",", ":")) + "\n", encoding="utf-8")
+
+
+def chi_square_critical(dof: int, z: float = 3.09) -> float:
+    """
+    Approximate upper critical value of the chi-square distribution
+    (Wilson-Hilferty). z=3.09 corresponds to a 0.001 significance level.
+    """
+    h = 2.0 / (9.0 * dof)
+    return dof * (1.0 - h + z * math.sqrt(h)) ** 3
+
+
+def chi_square_test(counts: list[int], weights: list[float]) -> tuple[float, float]:
+    """
+    Compare observed counts to the distribution given by weights with a
+    chi-square goodness-of-fit test.
+
+    Returns (statistic, critical_value); the sample passes if statistic < critical.
+    """
+    samples = sum(counts)
+    total = sum(weights)
+    statistic = 0.0
+    dof = 0
+    for count, weight in zip(counts, weights):
+        expected = samples * weight / total
+        if expected == 0:
+            if count:
+                return math.inf, 0.0
+            continue
+        statistic += (count - expected) ** 2 / expected
+        dof += 1
+
+    return statistic, chi_square_critical(max(dof - 1, 1))
+
+
+def check_sampling_distribution(weights: list[float], samples: int = 200_000,
+                                seed: int = 0) -> tuple[float, float]:
+    """
+    Sample from an alias table built from raw weights and test the observed
+    counts against the weights. Returns (statistic, critical_value).
+    """
+    rng = random.Random(seed)
+    members = list(range(len(weights)))
+    prob, alias = build_alias_table(weights)
+
+    counts = [0] * len(weights)
+    for _ in range(samples):
+        counts[sample_alias(members, prob, alias, rng)] += 1
+
+    return chi_square_test(counts, weights)
+
+
+def check_emitted_table(table: dict, members: list[int], expected: list[float],
+                        samples: int = 100_000, seed: int = 0) -> tuple[float, float]:
+    """
+    Sample from one emitted table (rounded prob, aliases remapped to "ids"
+    indices) and test the counts against expected per-ID weights.
+    Returns (statistic, critical_value).
+    """
+    rng = random.Random(seed)
+    counts = [0] * len(expected)
+    for _ in range(samples):
+        counts[sample_alias(members, table["prob"], table["alias"], rng)] += 1
+
+    # Only members can be drawn; everything else is expected to stay at zero
+    member_set = set(members)
+    weights = [weight if i in member_set else 0.0 for i, weight in enumerate(expected)]
+    return chi_square_test(counts, weights)
+
+
+def _synthetic_terms(count: int, seed: int = 0) -> list[Term]:
+    """Generate a small linked corpus with a spread of degrees for checks."""
+    rng = random.Random(seed)
+    names = [f"Check Term {i}" for i in range(count)]
+    terms = []
+    for i, name in enumerate(names):
+        term = Term(f"{name} ✓", "Checks")
+        term.links = [Term.normalize_to_id(other) for other in rng.sample(names, rng.randint(0, 6))
+                      if other != name]
+        # Mention a neighbour so auto links contribute to degrees too
+        term.definition_lines = [f"Related to {names[(i + 1) % count]} in some way."]
+        terms.append(term)
+    return terms
+
+
+def run_emitted_table_checks() -> bool:
+    """Sample the tables build_shuffle_tables() emits, after a JSON round trip."""
+    terms = _synthetic_terms(60)
+    tables = json.loads(json.dumps(build_shuffle_tables(terms), separators=(",", ":")))
+
+    ids = tables["ids"]
+    degrees = tables["degrees"]
+    ordered = sorted(terms, key=lambda t: t.id)
+    centrality = pagerank(build_adjacency(ordered))
+
+    all_passed = True
+    for threshold, entry in tables["thresholds"].items():
+        for scheme, table in entry["tables"].items():
+            expected = compute_weights(scheme, ids, degrees, centrality)
+            statistic, critical = check_emitted_table(table, entry["members"], expected)
+            passed = statistic < critical
+            all_passed = all_passed and passed
+            status = "✓" if passed else "✗"
+            print(f"  {status} emitted t={threshold} {scheme}: chi2={statistic:.2f} "
+                  f"(critical {critical:.2f}, n={len(entry['members'])})")
+
+    return all_passed
+
+
+def run_checks() -> bool:
+    """Run the sampling distribution check over a few representative weight sets."""
+    rng = random.Random(42)
+    cases = {
+        "uniform": [1.0] * 50,
+        "degree-like": [float(rng.randint(1, 20)) for _ in range(200)],
+        "skewed": [1.0 / (i + 1) ** 1.5 for i in range(100)],
+        "with-zeros": [0.0, 3.0, 0.0, 1.0, 6.0],
+        "single": [2.5],
+    }
+
+    all_passed = True
+    for name, weights in cases.items():
+        statistic, critical = check_sampling_distribution(weights)
+        passed = statistic < critical
+        all_passed = all_passed and passed
+        status = "✓" if passed else "✗"
+        print(f"  {status} {name}: chi2={statistic:.2f} (critical {critical:.2f}, n={len(weights)})")
+
+    return run_emitted_table_checks() and all_passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute Explore-mode shuffle tables.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Verify alias-table sampling against expected distributions (chi-square)"
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        print("Checking alias-table sampling distribution...")
+        if not run_checks():
+            raise SystemExit(1)
+        print("✓ All sampling checks passed")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
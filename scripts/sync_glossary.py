@@ -9,6 +9,7 @@ Usage:
     python scripts/sync_glossary.py                    # Normal sync
     python scripts/sync_glossary.py --dry-run          # Preview without writing files
     python scripts/sync_glossary.py --verbose          # Show detailed parsing info
+    python scripts/sync_glossary.py --docx export.docx # Sync offline from a .docx export
 
 Setup:
     1. Enable Google Docs API at https://console.cloud.google.com/
@@ -39,7 +40,7 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 # Google API imports - will be checked at runtime
 try:
@@ -190,9 +191,10 @@ class GoogleDocsParser:
     
     def parse_document(self, doc: dict, tab_name: str) -> list[Term]:
         """Parse a Google Docs document and extract terms."""
-        self.terms = []
-        self.current_section = "uncategorized"
-        
+        return self.parse_elements(self.find_content(doc, tab_name))
+    
+    def find_content(self, doc: dict, tab_name: str) -> list[dict]:
+        """Return the structural elements of the named tab (or the main body)."""
         # Find the correct tab
         tabs = doc.get("tabs", [])
         target_tab = None
@@ -207,13 +209,21 @@ class GoogleDocsParser:
             # If no tabs or tab not found, try the main body (older doc format)
             if "body" in doc:
                 self.log(f"No tab named '{tab_name}' found, using main document body")
-                content = doc["body"].get("content", [])
-            else:
-                available_tabs = [t.get("tabProperties", {}).get("title", "unnamed") for t in tabs]
-                raise ValueError(f"Tab '{tab_name}' not found. Available tabs: {available_tabs}")
-        else:
-            self.log(f"Found tab: {tab_name}")
-            content = target_tab.get("documentTab", {}).get("body", {}).get("content", [])
+                return doc["body"].get("content", [])
+            available_tabs = [t.get("tabProperties", {}).get("title", "unnamed") for t in tabs]
+            raise ValueError(f"Tab '{tab_name}' not found. Available tabs: {available_tabs}")
+        
+        self.log(f"Found tab: {tab_name}")
+        return target_tab.get("documentTab", {}).get("body", {}).get("content", [])
+    
+    def parse_elements(self, content: Iterable[dict], section: str = "uncategorized") -> list[Term]:
+        """
+        Parse a sequence of structural elements (Docs API shape) into terms.
+        Elements are consumed one at a time, so `content` can be a generator.
+        `section` is the Heading 1 in effect before the first element.
+        """
+        self.terms = []
+        self.current_section = section
         
         # Parse content elements
         current_term: Optional[Term] = None
@@ -367,7 +377,7 @@ def get_google_credentials(scripts_dir: Path) -> "Credentials":
     return creds
 
 
-def fetch_document(creds: Credentials, doc_id: str) -> dict:
+def fetch_document(creds: "Credentials", doc_id: str) -> dict:
     """Fetch document content from Google Docs API."""
     service = build("docs", "v1", credentials=creds)
 
@@ -449,11 +459,14 @@ def normalize_and_validate_links(terms: list[Term], verbose: bool = False) -> di
     return invalid_links
 
 
-def sync_glossary(dry_run: bool = False, verbose: bool = False):
-    """Main sync function."""
+def sync_glossary(dry_run: bool = False, verbose: bool = False, docx_path: Optional[Path] = None):
+    """
+    Main sync function.
+    If docx_path is given, terms are read from that .docx export instead of the Docs API.
+    """
     
-    # Check for Google libraries
-    if not GOOGLE_LIBS_AVAILABLE:
+    # Check for Google libraries (not needed for offline .docx sync)
+    if docx_path is None and not GOOGLE_LIBS_AVAILABLE:
         print("Error: Google API libraries not installed.")
         print("\nInstall with:")
         print("  pip install google-auth google-auth-oauthlib google-api-python-client")
@@ -465,7 +478,7 @@ def sync_glossary(dry_run: bool = False, verbose: bool = False):
     output_dir = project_root / CONFIG["output_dir"]
     
     # Check doc ID is configured
-    if CONFIG["doc_id"] == "YOUR_DOC_ID_HERE":
+    if docx_path is None and CONFIG["doc_id"] == "YOUR_DOC_ID_HERE":
         print("Error: Please set your Google Doc ID in the CONFIG section of this script.")
         print("\nTo find your doc ID, look at your Google Doc URL:")
         print("  https://docs.google.com/document/d/YOUR_DOC_ID_HERE/edit")
@@ -477,30 +490,53 @@ def sync_glossary(dry_run: bool = False, verbose: bool = False):
         print(f"Error: Output directory does not exist: {output_dir}")
         sys.exit(1)
     
+    # Check .docx export exists
+    if docx_path is not None and not docx_path.exists():
+        print(f"Error: .docx export not found: {docx_path}")
+        sys.exit(1)
+    
     print("=" * 60)
     print("League Strategic Glossary Sync")
     print("=" * 60)
-    print(f"Doc ID: {CONFIG['doc_id'][:20]}...")
-    print(f"Tab: {CONFIG['tab_name']}")
+    if docx_path is None:
+        print(f"Doc ID: {CONFIG['doc_id'][:20]}...")
+        print(f"Tab: {CONFIG['tab_name']}")
+    else:
+        print(f"Source: {docx_path} (offline .docx export)")
     print(f"Output: {output_dir}")
     print(f"Mode: {'DRY RUN (no files written)' if dry_run else 'LIVE'}")
     print("=" * 60)
     
-    # Authenticate
-    print("\n[1/4] Authenticating with Google...")
-    creds = get_google_credentials(script_dir)
-    print("  ✓ Authenticated")
-    
-    # Fetch document
-    print("\n[2/4] Fetching document...")
-    doc = fetch_document(creds, CONFIG["doc_id"])
-    title = doc.get("title", "Untitled")
-    print(f"  ✓ Fetched: {title}")
-    
-    # Parse terms
-    print("\n[3/5] Parsing terms...")
-    parser = GoogleDocsParser(verbose=verbose)
-    terms = parser.parse_document(doc, CONFIG["tab_name"])
+    if docx_path is None:
+        # Authenticate
+        print("\n[1/9] Authenticating with Google...")
+        creds = get_google_credentials(script_dir)
+        print("  ✓ Authenticated")
+        
+        # Fetch document
+        print("\n[2/9] Fetching document...")
+        doc = fetch_document(creds, CONFIG["doc_id"])
+        title = doc.get("title", "Untitled")
+        revision = doc.get("revisionId")
+        print(f"  ✓ Fetched: {title}")
+        
+        # Parse terms (section-parallel for very large docs)
+        print("\n[3/9] Parsing terms...")
+        from parallel_parse import parse_document
+        
+        terms = parse_document(doc, CONFIG["tab_name"], verbose=verbose)
+    else:
+        from docx_source import docx_revision, parse_docx, read_docx_title
+
+        print("\n[1/9] Skipping authentication (offline .docx source)")
+        
+        print("\n[2/9] Opening .docx export...")
+        print(f"  ✓ Opened: {read_docx_title(docx_path)}")
+        revision = docx_revision(docx_path)
+        
+        # Parse terms (streamed straight out of word/document.xml)
+        print("\n[3/9] Parsing terms...")
+        terms = parse_docx(docx_path, verbose=verbose)
 
     completed = [t for t in terms if t.is_completed]
     in_progress = [t for t in terms if t.is_in_progress]
@@ -519,7 +555,7 @@ def sync_glossary(dry_run: bool = False, verbose: bool = False):
             print(f"    ... and {len(no_status) - 5} more")
 
     # Normalize and validate links
-    print("\n[4/5] Normalizing and validating links...")
+    print("\n[4/9] Normalizing and validating links...")
     # Only normalize links for completed terms (the ones we'll sync)
     invalid_links = normalize_and_validate_links(completed, verbose=verbose)
 
@@ -535,10 +571,16 @@ def sync_glossary(dry_run: bool = False, verbose: bool = False):
     else:
         print("  ✓ All links are valid")
 
+    # Snapshot the previous sync state for the change feed before files are overwritten
+    from change_feed import FEED_CONFIG, load_sync_state, record_sync
+
+    previous_state = load_sync_state(project_root)
+
     # Write files
-    print("\n[5/5] Writing markdown files...")
+    print("\n[5/9] Writing markdown files...")
     written = 0
     errors = []
+    failed_ids = set()
     
     for term in completed:
         filepath = output_dir / term.filename
@@ -554,7 +596,69 @@ def sync_glossary(dry_run: bool = False, verbose: bool = False):
                 written += 1
             except Exception as e:
                 errors.append(f"{term.filename}: {e}")
+                failed_ids.add(term.id)
                 print(f"  ✗ {term.filename}: {e}")
+
+    # Later stages describe the published corpus: every file in the terms
+    # directory (what generate-glossary-data.ts reads), not just this sync
+    from term_corpus import load_corpus_terms
+
+    published = load_corpus_terms(output_dir, synced=[t for t in completed if t.id not in failed_ids])
+
+    # Precompute shuffle tables
+    print("\n[6/9] Building shuffle tables...")
+    from shuffle_tables import SHUFFLE_TABLES_CONFIG, build_shuffle_tables, write_shuffle_tables
+
+    shuffle_tables = build_shuffle_tables(published)
+    shuffle_path = project_root / SHUFFLE_TABLES_CONFIG["output_file"]
+    print(f"  {len(shuffle_tables['ids'])} term(s), {len(shuffle_tables['thresholds'])} threshold(s) x {len(SHUFFLE_TABLES_CONFIG['schemes'])} weight scheme(s)")
+    if dry_run:
+        print(f"  [DRY RUN] Would write: {SHUFFLE_TABLES_CONFIG['output_file']}")
+    else:
+        write_shuffle_tables(shuffle_tables, shuffle_path)
+        print(f"  ✓ {SHUFFLE_TABLES_CONFIG['output_file']}")
+
+    # Render OpenGraph share cards
+    print("\n[7/9] Rendering OpenGraph images...")
+    from og_images import OG_CONFIG, PIL_AVAILABLE, render_og_images
+
+    if not PIL_AVAILABLE:
+        print("  ⚠️  Pillow not installed - skipping (pip install Pillow)")
+    else:
+        og_stats = render_og_images(published, project_root, dry_run=dry_run, verbose=verbose)
+        prefix = "[DRY RUN] Would render" if dry_run else "✓ Rendered"
+        print(f"  {prefix} {og_stats['rendered']} card(s), {og_stats['cached']} unchanged, "
+              f"{og_stats['removed']} removed ({OG_CONFIG['output_dir']})")
+
+    # Suggest related terms for "See also" review
+    print("\n[8/9] Suggesting related terms...")
+    from related_terms import NUMPY_AVAILABLE, RELATED_CONFIG, suggest_related_terms, write_suggestions
+
+    if not NUMPY_AVAILABLE:
+        print("  ⚠️  NumPy/SciPy not installed - skipping (pip install numpy scipy)")
+    else:
+        suggestions = suggest_related_terms(published)
+        print(f"  {sum(len(s) for s in suggestions.values())} suggestion(s) for {len(suggestions)} term(s)")
+        if dry_run:
+            print(f"  [DRY RUN] Would write: {RELATED_CONFIG['output_file']}")
+        else:
+            write_suggestions(suggestions, project_root / RELATED_CONFIG["output_file"])
+            print(f"  ✓ {RELATED_CONFIG['output_file']}")
+
+    # Append to the change feed for incremental downstream consumers
+    print("\n[9/9] Recording change feed...")
+    events = record_sync(completed, project_root, revision, previous_state,
+                         dry_run=dry_run, keep_ids=failed_ids)
+    counts = {}
+    for event in events:
+        counts[event["type"]] = counts.get(event["type"], 0) + 1
+    counts_str = ", ".join(f"{count} {event_type}" for event_type, count in sorted(counts.items()))
+    if not events:
+        print("  ✓ No changes since last sync")
+    elif dry_run:
+        print(f"  [DRY RUN] Would append {len(events)} event(s): {counts_str}")
+    else:
+        print(f"  ✓ Appended {len(events)} event(s) to {FEED_CONFIG['feed_dir']}: {counts_str}")
     
     # Summary
     print("\n" + "=" * 60)
@@ -587,6 +691,7 @@ Examples:
   python scripts/sync_glossary.py --dry-run    # Preview changes
   python scripts/sync_glossary.py --verbose    # Detailed output
   python scripts/sync_glossary.py -v --dry-run # Preview with details
+  python scripts/sync_glossary.py --docx glossary.docx  # Offline sync from .docx export
         """
     )
     parser.add_argument(
@@ -599,9 +704,15 @@ Examples:
         action="store_true",
         help="Show detailed parsing information"
     )
+    parser.add_argument(
+        "--docx",
+        type=Path,
+        metavar="PATH",
+        help="Sync from a .docx export instead of the Google Docs API (no auth needed)"
+    )
     
     args = parser.parse_args()
-    sync_glossary(dry_run=args.dry_run, verbose=args.verbose)
+    sync_glossary(dry_run=args.dry_run, verbose=args.verbose, docx_path=args.docx)
 
 
 if __name__ == "__main__":
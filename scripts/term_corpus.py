@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Fast frontmatter-only loader for the existing terms in src/data/terms.
+
+Tooling that compares the doc against the site (diffing, reporting, orphan
+detection) usually only needs each term's frontmatter. This loader:
+
+    - Lists files with os.scandir (no per-file stat calls)
+    - Reads each file only up to the closing "---" of its frontmatter
+    - Parses the restricted YAML subset that Term.to_markdown() and
+      import_terms.create_markdown_file() emit, without a YAML library:
+          key: scalar
+          key: [item, "quoted item", ...]
+    - Loads files concurrently in a thread pool
+    - Reads definition bodies lazily, only when .body is accessed
+
+load_corpus_terms() wraps the records as Term objects for sync stages that
+must describe the published corpus (every file in src/data/terms, which is
+what generate-glossary-data.ts reads), not just the terms in one sync.
+
+Anything outside that subset (e.g. a hand-written nested `media:` block)
+is kept as raw YAML text in TermRecord.extra rather than parsed.
+
+Usage:
+    python scripts/term_corpus.py                            # Summarize src/data/terms
+    python scripts/term_corpus.py --benchmark                # 50k-file synthetic corpus
+    python scripts/term_corpus.py --benchmark --files 10000
+"""
+
+import argparse
+import os
+import re
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from sync_glossary import Term
+
+# PyYAML is only used as the full-parse baseline in --benchmark
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+
+# Configuration
+CORPUS_CONFIG = {
+    # Terms directory relative to project root
+    "terms_dir": "src/data/terms",
+
+    # Loader threads (None = ThreadPoolExecutor default)
+    "workers": None,
+
+    # Files handed to each worker task (amortizes executor overhead)
+    "chunk_size": 256,
+
+    # Bytes read per system call while looking for the closing "---"
+    # (generated frontmatter almost always fits in one read)
+    "read_size": 1024,
+}
+
+# List-valued keys that are always returned as lists, even when absent
+LIST_FIELDS = ("tags", "alternates", "links")
+
+FRONTMATTER_DELIMITER = b"---"
+
+# One flow-list item: a double-quoted string, a single-quoted string, or bare text up to a comma
+FLOW_ITEM_RE = re.compile(r"""\s*("(?:[^"\\]|\\.)*"|'(?:[^']|'')*'|[^,]*?)\s*(?:,|$)""")
+
+
+class TermRecord:
+    """Frontmatter of one term file, with the definition body loaded on demand."""
+
+    def __init__(self, path: Path, fields: dict[str, Union[str, list[str]]],
+                 body_offset: int, extra: dict[str, str]):
+        self.path = path
+        self.id: str = fields.get("id", "")
+        self.term: str = fields.get("term", "")
+        self.tags: list[str] = fields.get("tags", [])
+        self.alternates: list[str] = fields.get("alternates", [])
+        self.links: list[str] = fields.get("links", [])
+        self.fields = fields
+        self.extra = extra
+        self.body_offset = body_offset
+        self._body: Optional[str] = None
+
+    @property
+    def filename(self) -> str:
+        """Markdown filename."""
+        return self.path.name
+
+    @property
+    def body(self) -> str:
+        """Definition text (trimmed, like gray-matter's content.trim()), read on first access."""
+        if self._body is None:
+            with open(self.path, "rb") as f:
+                f.seek(self.body_offset)
+                self._body = f.read().decode("utf-8").strip()
+        return self._body
+
+
+def _unquote(value: str) -> str:
+    """Strip matching single or double quotes from a scalar."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        inner = value[1:-1]
+        if value[0] == '"':
+            return inner.replace('\\"', '"').replace("\\\\", "\\")
+        return inner.replace("''", "'")
+    return value
+
+
+def _split_flow_list(value: str) -> list[str]:
+    """Split the inside of a flow list ("a, "b, c", d") on commas outside quotes."""
+    if '"' not in value and "'" not in value:
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return [_unquote(item.strip()) for item in FLOW_ITEM_RE.findall(value) if item.strip()]
+
+
+def parse_frontmatter_value(value: str) -> Union[str, list[str]]:
+    """Parse a single frontmatter value: a flow list or a (possibly quoted) scalar."""
+    value = value.strip()
+    if value.startswith("[") and value.endswith("]"):
+        return _split_flow_list(value[1:-1])
+    return _unquote(value)
+
+
+def parse_frontmatter_lines(lines: list[str]) -> tuple[dict[str, Union[str, list[str]]], dict[str, str]]:
+    """
+    Parse frontmatter lines in the restricted subset.
+    Returns (fields, extra) where extra holds raw YAML for keys with nested blocks.
+    """
+    fields: dict[str, Union[str, list[str]]] = {}
+    extra: dict[str, list[str]] = {}
+    block_key: Optional[str] = None
+
+    for line in lines:
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+
+        # Indented or "- item" lines belong to the previous key's nested block
+        if line[0] in " \t-":
+            if block_key is not None:
+                extra[block_key].append(line)
+            continue
+
+        key, sep, value = line.partition(":")
+        if not sep:
+            raise ValueError(f"Unsupported frontmatter line: {line!r}")
+        key = key.strip()
+
+        if value.strip():
+            fields[key] = parse_frontmatter_value(value)
+            block_key = None
+        else:
+            # "key:" with nothing after it starts a nested block we don't parse
+            block_key = key
+            extra[key] = []
+
+    for key in LIST_FIELDS:
+        value = fields.get(key)
+        if value is None:
+            fields[key] = []
+        elif isinstance(value, str):
+            fields[key] = [value]
+
+    return fields, {key: "\n".join(block) for key, block in extra.items()}
+
+
+def _find_closing_delimiter(head: bytes) -> tuple[int, int]:
+    """
+    Locate the closing "---" line in the bytes read so far.
+    Returns (frontmatter_end, body_offset), or (-1, -1) if more bytes are needed.
+    """
+    start = 3
+    while True:
+        end = head.find(b"\n" + FRONTMATTER_DELIMITER, start)
+        if end == -1:
+            return -1, -1
+        after = end + 1 + len(FRONTMATTER_DELIMITER)
+        if after == len(head):
+            # Can't tell yet whether the line ends here
+            return -1, -1
+        line_end = head.find(b"\n", after)
+        if head[after:line_end if line_end != -1 else len(head)].strip() == b"":
+            if line_end == -1:
+                return -1, -1
+            return end, line_end + 1
+        start = after
+
+
+def read_frontmatter(path: Path) -> TermRecord:
+    """
+    Read and parse only the frontmatter block of a term file.
+    Reads in small fixed-size chunks until the closing "---" line is seen.
+    """
+    read_size = CORPUS_CONFIG["read_size"]
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        head = os.read(fd, read_size)
+        first_line_end = head.find(b"\n")
+        if first_line_end == -1 or head[:first_line_end].rstrip() != FRONTMATTER_DELIMITER:
+            raise ValueError(f"Invalid term file: {path.name}. Missing frontmatter.")
+
+        frontmatter_end, body_offset = _find_closing_delimiter(head)
+        while frontmatter_end == -1:
+            chunk = os.read(fd, read_size)
+            if not chunk:
+                # Closing delimiter may be the very last line of the file
+                if head.rstrip().endswith(b"\n" + FRONTMATTER_DELIMITER):
+                    frontmatter_end, body_offset = head.rstrip().rfind(b"\n"), len(head)
+                    break
+                raise ValueError(f"Invalid term file: {path.name}. Unterminated frontmatter.")
+            head += chunk
+            frontmatter_end, body_offset = _find_closing_delimiter(head)
+    finally:
+        os.close(fd)
+
+    text = head[first_line_end + 1:frontmatter_end].decode("utf-8")
+    lines = [line.rstrip("\r") for line in text.split("\n")] if text else []
+
+    fields, extra = parse_frontmatter_lines(lines)
+    if not fields.get("id") or not fields.get("term") or not fields.get("tags"):
+        raise ValueError(f"Invalid term file: {path.name}. Missing required frontmatter fields.")
+
+    return TermRecord(path, fields, body_offset, extra)
+
+
+def scan_term_files(terms_dir: Path) -> list[Path]:
+    """List markdown files in the terms directory, sorted by filename."""
+    with os.scandir(terms_dir) as entries:
+        names = [entry.name for entry in entries if entry.name.endswith(".md") and entry.is_file()]
+    names.sort()
+    return [terms_dir / name for name in names]
+
+
+def _read_chunk(paths: list[Path]) -> list[TermRecord]:
+    """Read frontmatter for a chunk of files (one executor task)."""
+    return [read_frontmatter(path) for path in paths]
+
+
+def load_corpus(terms_dir: Optional[Path] = None, workers: Optional[int] = None) -> list[TermRecord]:
+    """
+    Load frontmatter for every term file, concurrently.
+    Records are returned in filename order. Raises ValueError on invalid files.
+    """
+    if terms_dir is None:
+        terms_dir = Path(__file__).parent.parent / CORPUS_CONFIG["terms_dir"]
+    if workers is None:
+        workers = CORPUS_CONFIG["workers"]
+
+    paths = scan_term_files(terms_dir)
+    size = CORPUS_CONFIG["chunk_size"]
+    chunks = [paths[i:i + size] for i in range(0, len(paths), size)]
+
+    if len(chunks) <= 1:
+        return _read_chunk(paths)
+
+    records = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for chunk_records in pool.map(_read_chunk, chunks):
+            records.extend(chunk_records)
+    return records
+
+
+class CorpusTerm(Term):
+    """Term loaded from a markdown file, keeping the frontmatter ID and tags as written."""
+
+    def __init__(self, record: TermRecord):
+        super().__init__(record.term, "")
+        self._id = record.id or Term.normalize_to_id(record.term)
+        self._tags = record.tags
+        self.alternates = record.alternates
+        self.links = record.links
+        self.definition_lines = [record.body]
+        self.is_completed = True
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def effective_tags(self) -> list[str]:
+        return self._tags
+
+
+def load_corpus_terms(terms_dir: Optional[Path] = None, synced: Iterable[Term] = (),
+                      workers: Optional[int] = None) -> list[Term]:
+    """
+    Load the published corpus as Term objects, in filename order.
+
+    `synced` terms replace the file with the same ID (or are appended), so a
+    dry run sees the corpus as the sync would leave it.
+    """
+    terms: dict[str, Term] = {}
+    if terms_dir is None or terms_dir.exists():
+        for record in load_corpus(terms_dir, workers=workers):
+            term = CorpusTerm(record)
+            terms[term.id] = term
+    for term in synced:
+        terms[term.id] = term
+    return list(terms.values())
+
+
+def _full_parse(path: Path) -> dict:
+    """Benchmark baseline: read the whole file and parse frontmatter with PyYAML."""
+    content = path.read_text(encoding="utf-8")
+    _, frontmatter, body = content.split("---\n", 2)
+    data = yaml.load(frontmatter, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    data["definition"] = body.strip()
+    return data
+
+
+def _write_synthetic_corpus(terms_dir: Path, count: int):
+    """Write a synthetic corpus in the same format Term.to_markdown() emits."""
+    words = ("wave lane pressure tempo vision objective jungle gank trade "
+             "recall item gold priority rotation fight").split()
+    # Realistic definitions are a few paragraphs long
+    paragraph = " ".join(words[j % len(words)] for j in range(120))
+    body = "\n\n".join([paragraph] * 4)
+    for i in range(count):
+        lines = [
+            "---",
+            f"id: synthetic-term-{i}",
+            f"term: Synthetic Term {i}",
+            f"tags: [strategy, {words[i % len(words)]}]",
+        ]
+        if i % 4 == 0:
+            lines.append(f'alternates: ["alt {i}", "other, form {i}"]')
+        if i % 3 == 0:
+            lines.append(f"links: [synthetic-term-{(i + 1) % count}, synthetic-term-{(i + 7) % count}]")
+        lines += ["---", "", body, ""]
+        (terms_dir / f"synthetic-term-{i}.md").write_text("\n".join(lines), encoding="utf-8")
+
+
+def run_benchmark(count: int, workers: Optional[int]):
+    """Benchmark frontmatter-only loading against a full parse of every file."""
+    tmp_dir = Path(tempfile.mkdtemp(prefix="corpus-bench-"))
+    try:
+        print(f"Writing {count} synthetic term files...")
+        _write_synthetic_corpus(tmp_dir, count)
+
+        def timed(label: str, fn):
+            start = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - start
+            print(f"  {label:<40} {elapsed:8.2f}s")
+            return result
+
+        print(f"Benchmarking ({count} files)")
+        full = timed("full parse (read all + PyYAML)",
+                     lambda: [_full_parse(p) for p in sorted(tmp_dir.glob("*.md"))])
+
+        timed("frontmatter only (sequential)", lambda: load_corpus(tmp_dir, workers=1))
+        records = timed("frontmatter only (threaded)", lambda: load_corpus(tmp_dir, workers=workers))
+
+        # Sanity check: the fast parser agrees with PyYAML
+        for record, data in zip(records, full):
+            for key in ("id", "term", *LIST_FIELDS):
+                if record.fields.get(key) != data.get(key, [] if key in LIST_FIELDS else None):
+                    raise SystemExit(f"✗ Mismatch in {record.filename} ({key})")
+            if record.body != data["definition"]:
+                raise SystemExit(f"✗ Body mismatch in {record.filename}")
+        print("  ✓ Frontmatter and lazy bodies match the full parse")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load term frontmatter from src/data/terms.")
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Benchmark against a full parse on a synthetic corpus"
+    )
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=50_000,
+        help="Synthetic corpus size for --benchmark (default: 50000)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Loader threads (default: ThreadPoolExecutor default)"
+    )
+    args = parser.parse_args()
+
+    if args.benchmark:
+        if not YAML_AVAILABLE:
+            print("Error: PyYAML not installed (needed for the full-parse baseline).")
+            print("\nInstall with:")
+            print("  pip install PyYAML")
+            raise SystemExit(1)
+        run_benchmark(args.files, args.workers)
+        return
+
+    records = load_corpus(workers=args.workers)
+    tag_counts: dict[str, int] = {}
+    for record in records:
+        for tag in record.tags:
+            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+
+    print(f"Loaded {len(records)} terms from {CORPUS_CONFIG['terms_dir']}")
+    for tag, count in sorted(tag_counts.items(), key=lambda item: (-item[1], item[0])):
+        print(f"  {tag}: {count}")
+
+
+if __name__ == "__main__":
+    main()
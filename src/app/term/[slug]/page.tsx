@@ -34,6 +34,14 @@ export async function generateMetadata({ params }: TermPageProps): Promise<Metad
     .filter(Boolean)
     .join(', ');
 
+  // Share card pre-rendered by scripts/og_images.py during sync
+  const image = {
+    url: `https://glossary.steffnstuff.com/images/og/${term.id}.png`,
+    width: 1200,
+    height: 630,
+    alt: term.term,
+  };
+
   return {
     title: `${term.term} - League Strategic Glossary`,
     description,
@@ -44,11 +52,13 @@ export async function generateMetadata({ params }: TermPageProps): Promise<Metad
       siteName: 'League Strategic Glossary',
       type: 'article',
       tags: tagLabels ? [tagLabels] : undefined,
+      images: [image],
     },
     twitter: {
-      card: 'summary',
+      card: 'summary_large_image',
       title: term.term,
       description,
+      images: [image.url],
     },
   };
 }